@@ -7,107 +7,137 @@ Since we can't generate actual STEP/STL files without CAD libraries,
 this script creates instructions and JSON metadata for test scenarios.
 
 Usage:
-    python generate_test_fixtures.py [--output-dir fixtures] [--format json|instructions]
+    python generate_test_fixtures.py [--output-dir fixtures] [--format json|instructions] [--pretty]
 
 Author: Fusion CoPilot Team
 License: MIT
 """
 
 import json
+import logging
 import os
 import argparse
-from datetime import datetime
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Optional fast JSON encoder; falls back to the stdlib encoder when missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Static markdown copied into the output directory
+_ASSETS_DIR = Path(__file__).parent / "assets"
+
+# Complexity class per geometry type; anything not listed is "complex"
+_COMPLEXITY = {
+    "rectangle": "simple",
+    "circle": "simple",
+    "cube": "simple",
+    "cylinder": "intermediate",
+    "hexagon": "intermediate",
+    "pattern": "intermediate",
+}
+
+# Basic fixtures as (name, description, geometry_type, dimensions) rows
+_BASIC_SPECS = (
+    ("simple_plate", "Basic rectangular plate for extrusion testing",
+     "rectangle", {"width": 100, "height": 50, "thickness": 5}),
+    ("unit_cube", "25mm cube for basic operations testing",
+     "cube", {"width": 25, "height": 25, "depth": 25}),
+    ("circular_disk", "Circular disk for hole and pattern testing",
+     "circle", {"diameter": 60, "thickness": 8}),
+    ("test_cylinder", "Cylindrical part for revolve and cut testing",
+     "cylinder", {"diameter": 30, "height": 40}),
+    ("hex_prism", "Hexagonal prism for polygon testing",
+     "hexagon", {"across_flats": 20, "height": 15}),
+)
+
+# Timestamp shared by every fixture generated in this run
+_run_timestamp: Optional[str] = None
+
+
+def _now() -> str:
+    """Return the run timestamp, computing it on first use.
+
+    Set FIXTURES_TIMESTAMP to pin the value for reproducible output.
+    """
+    global _run_timestamp
+    if _run_timestamp is None:
+        _run_timestamp = os.environ.get("FIXTURES_TIMESTAMP") or (
+            datetime.now(timezone.utc).isoformat(timespec="microseconds").replace("+00:00", "Z"))
+    return _run_timestamp
+
+
+@dataclass(slots=True, frozen=True)
+class Fixture:
+    """Metadata for a basic geometric test fixture."""
+    name: str
+    description: str
+    geometry_type: str
+    dimensions: Dict
+    units: str = "mm"
+    created_at: str = ""
+    format: str = "metadata_only"
+    usage: str = "testing"
+    complexity: str = ""
 
 
 def create_fixture_metadata(name: str, description: str, geometry_type: str, 
-                          dimensions: Dict, units: str = "mm") -> Dict:
+                          dimensions: Dict, units: str = "mm") -> Fixture:
     """Create metadata for a test fixture."""
-    return {
-        "name": name,
-        "description": description,
-        "geometry_type": geometry_type,
-        "dimensions": dimensions,
-        "units": units,
-        "created_at": datetime.utcnow().isoformat() + "Z",
-        "format": "metadata_only",
-        "usage": "testing",
-        "complexity": classify_complexity(geometry_type, dimensions)
-    }
+    return Fixture(
+        name=name,
+        description=description,
+        geometry_type=geometry_type,
+        dimensions=dimensions,
+        units=units,
+        created_at=_now(),
+        # Same lookup as classify_complexity(), inlined to save a call per fixture
+        complexity=_COMPLEXITY.get(geometry_type, "complex")
+    )
+
+
+def _json_default(obj):
+    """Serialize Fixture records for the stdlib json encoder."""
+    if isinstance(obj, Fixture):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def classify_complexity(geometry_type: str, dimensions: Dict) -> str:
     """Classify fixture complexity based on geometry and dimensions."""
-    if geometry_type in ["rectangle", "circle", "cube"]:
-        return "simple"
-    elif geometry_type in ["cylinder", "hexagon", "pattern"]:
-        return "intermediate"
-    else:
-        return "complex"
+    return _COMPLEXITY.get(geometry_type, "complex")
 
 
-def generate_basic_fixtures() -> List[Dict]:
-    """Generate basic geometric test fixtures."""
-    fixtures = []
-    
-    # Simple rectangle plate
-    fixtures.append(create_fixture_metadata(
-        "simple_plate",
-        "Basic rectangular plate for extrusion testing",
-        "rectangle",
-        {"width": 100, "height": 50, "thickness": 5}
-    ))
-    
-    # Square cube
-    fixtures.append(create_fixture_metadata(
-        "unit_cube", 
-        "25mm cube for basic operations testing",
-        "cube",
-        {"width": 25, "height": 25, "depth": 25}
-    ))
-    
-    # Circular disk
-    fixtures.append(create_fixture_metadata(
-        "circular_disk",
-        "Circular disk for hole and pattern testing",
-        "circle",
-        {"diameter": 60, "thickness": 8}
-    ))
-    
-    # Cylinder
-    fixtures.append(create_fixture_metadata(
-        "test_cylinder",
-        "Cylindrical part for revolve and cut testing", 
-        "cylinder",
-        {"diameter": 30, "height": 40}
-    ))
-    
-    # Hexagonal prism
-    fixtures.append(create_fixture_metadata(
-        "hex_prism",
-        "Hexagonal prism for polygon testing",
-        "hexagon", 
-        {"across_flats": 20, "height": 15}
-    ))
-    
-    return fixtures
+def _mm_meta(complexity: str) -> Dict:
+    """Build the trailing units/complexity/created_at keys shared by hand-built fixtures."""
+    return {"units": "mm", "complexity": complexity, "created_at": _now()}
 
 
-def generate_complex_fixtures() -> List[Dict]:
-    """Generate complex test fixtures with multiple features."""
-    fixtures = []
-    
+def _rect_feature(width: float, height: float, thickness: float) -> Dict:
+    """Build a rectangular base feature for a complex fixture."""
+    return {
+        "type": "rectangle",
+        "dimensions": {"width": width, "height": height, "thickness": thickness}
+    }
+
+
+# Complex fixtures; units/complexity/created_at are added per call
+_COMPLEX_SPECS = (
     # Mounting plate with holes
-    fixtures.append({
+    {
         "name": "mounting_plate_4holes",
         "description": "Mounting plate with 4 corner holes for pattern testing",
         "geometry_type": "complex",
         "features": [
-            {
-                "type": "rectangle",
-                "dimensions": {"width": 80, "height": 60, "thickness": 8}
-            },
+            _rect_feature(80, 60, 8),
             {
                 "type": "hole_pattern",
                 "pattern_type": "rectangular",
@@ -115,64 +145,43 @@ def generate_complex_fixtures() -> List[Dict]:
                 "spacing": {"x": 60, "y": 40},
                 "count": {"x": 2, "y": 2}
             }
-        ],
-        "units": "mm",
-        "complexity": "intermediate",
-        "created_at": datetime.utcnow().isoformat() + "Z"
-    })
-    
+        ]
+    },
     # Part with cutout
-    fixtures.append({
+    {
         "name": "plate_with_cutout",
         "description": "Plate with rectangular cutout for cut operation testing",
         "geometry_type": "complex",
         "features": [
-            {
-                "type": "rectangle", 
-                "dimensions": {"width": 100, "height": 60, "thickness": 10}
-            },
+            _rect_feature(100, 60, 10),
             {
                 "type": "cutout",
                 "shape": "rectangle",
                 "dimensions": {"width": 30, "height": 20},
                 "position": {"x": 0, "y": 0}  # Center
             }
-        ],
-        "units": "mm",
-        "complexity": "intermediate",
-        "created_at": datetime.utcnow().isoformat() + "Z"
-    })
-    
+        ]
+    },
     # Filleted part
-    fixtures.append({
+    {
         "name": "filleted_block",
         "description": "Block with filleted edges for edge modification testing",
         "geometry_type": "complex",
         "features": [
-            {
-                "type": "rectangle",
-                "dimensions": {"width": 40, "height": 30, "thickness": 20}
-            },
+            _rect_feature(40, 30, 20),
             {
                 "type": "fillet",
                 "radius": 3,
                 "edges": "all"
             }
-        ],
-        "units": "mm", 
-        "complexity": "intermediate",
-        "created_at": datetime.utcnow().isoformat() + "Z"
-    })
-    
-    return fixtures
-
+        ]
+    },
+)
 
-def generate_assembly_fixtures() -> List[Dict]:
-    """Generate assembly test fixtures."""
-    fixtures = []
-    
+# Assembly fixtures; units/complexity/created_at are added per call
+_ASSEMBLY_SPECS = (
     # Simple two-part assembly
-    fixtures.append({
+    {
         "name": "simple_assembly",
         "description": "Two-part assembly for component testing",
         "geometry_type": "assembly",
@@ -184,121 +193,51 @@ def generate_assembly_fixtures() -> List[Dict]:
                 "position": {"x": 0, "y": 0, "z": 0}
             },
             {
-                "name": "mounting_block", 
+                "name": "mounting_block",
                 "type": "cube",
                 "dimensions": {"width": 20, "height": 20, "depth": 15},
                 "position": {"x": 0, "y": 0, "z": 10}
             }
-        ],
-        "units": "mm",
-        "complexity": "advanced",
-        "created_at": datetime.utcnow().isoformat() + "Z"
-    })
-    
-    return fixtures
+        ]
+    },
+)
+
+# Known up front, so metadata doesn't depend on building the fixtures first
+_TOTAL_FIXTURES = len(_BASIC_SPECS) + len(_COMPLEX_SPECS) + len(_ASSEMBLY_SPECS)
+
+
+# Fixtures are built once at import and shared by every caller; use
+# copy.deepcopy() on the result before mutating it
+BASIC_FIXTURES: Tuple[Fixture, ...] = tuple(
+    create_fixture_metadata(name, description, geometry_type, dimensions)
+    for name, description, geometry_type, dimensions in _BASIC_SPECS
+)
+COMPLEX_FIXTURES: Tuple[Dict, ...] = tuple(
+    {**spec, **_mm_meta("intermediate")} for spec in _COMPLEX_SPECS
+)
+ASSEMBLY_FIXTURES: Tuple[Dict, ...] = tuple(
+    {**spec, **_mm_meta("advanced")} for spec in _ASSEMBLY_SPECS
+)
+
+
+def generate_basic_fixtures() -> Tuple[Fixture, ...]:
+    """Generate basic geometric test fixtures."""
+    return BASIC_FIXTURES
+
+
+def generate_complex_fixtures() -> Tuple[Dict, ...]:
+    """Generate complex test fixtures with multiple features."""
+    return COMPLEX_FIXTURES
+
+
+def generate_assembly_fixtures() -> Tuple[Dict, ...]:
+    """Generate assembly test fixtures."""
+    return ASSEMBLY_FIXTURES
 
 
 def generate_step_file_instructions() -> str:
     """Generate instructions for creating STEP files manually."""
-    return """
-# STEP File Creation Instructions
-
-Since this development environment cannot generate actual STEP files, 
-follow these instructions to create test fixtures manually in Fusion 360:
-
-## Basic Fixtures
-
-### 1. Simple Plate (simple_plate.step)
-1. Create new design
-2. Create sketch on XY plane
-3. Draw rectangle: 100mm x 50mm, centered at origin
-4. Extrude: 5mm upward
-5. Export as STEP: simple_plate.step
-
-### 2. Unit Cube (unit_cube.step)  
-1. Create new design
-2. Create sketch on XY plane
-3. Draw square: 25mm x 25mm, centered at origin
-4. Extrude: 25mm upward
-5. Export as STEP: unit_cube.step
-
-### 3. Circular Disk (circular_disk.step)
-1. Create new design
-2. Create sketch on XY plane  
-3. Draw circle: 60mm diameter, centered at origin
-4. Extrude: 8mm upward
-5. Export as STEP: circular_disk.step
-
-### 4. Test Cylinder (test_cylinder.step)
-1. Create new design
-2. Create sketch on XY plane
-3. Draw circle: 30mm diameter, centered at origin  
-4. Extrude: 40mm upward
-5. Export as STEP: test_cylinder.step
-
-### 5. Hexagonal Prism (hex_prism.step)
-1. Create new design
-2. Create sketch on XY plane
-3. Draw polygon: 6 sides, 20mm across flats, centered at origin
-4. Extrude: 15mm upward  
-5. Export as STEP: hex_prism.step
-
-## Complex Fixtures
-
-### 6. Mounting Plate with 4 Holes (mounting_plate_4holes.step)
-1. Create new design
-2. Create sketch on XY plane
-3. Draw rectangle: 80mm x 60mm, centered at origin
-4. Extrude: 8mm upward
-5. Create holes: 6mm diameter at corners (±30mm, ±20mm from center)
-6. Export as STEP: mounting_plate_4holes.step
-
-### 7. Plate with Cutout (plate_with_cutout.step)
-1. Create new design  
-2. Create sketch on XY plane
-3. Draw rectangle: 100mm x 60mm, centered at origin
-4. Extrude: 10mm upward
-5. Create sketch on top face
-6. Draw rectangle: 30mm x 20mm, centered 
-7. Cut extrude: through all
-8. Export as STEP: plate_with_cutout.step
-
-### 8. Filleted Block (filleted_block.step)
-1. Create new design
-2. Create sketch on XY plane  
-3. Draw rectangle: 40mm x 30mm, centered at origin
-4. Extrude: 20mm upward
-5. Fillet all edges: 3mm radius
-6. Export as STEP: filleted_block.step
-
-## Usage in Testing
-
-Place generated STEP files in the fixtures/ directory:
-```
-fixtures/
-├── simple_plate.step
-├── unit_cube.step  
-├── circular_disk.step
-├── test_cylinder.step
-├── hex_prism.step
-├── mounting_plate_4holes.step
-├── plate_with_cutout.step
-└── filleted_block.step
-```
-
-These files can then be imported into test scenarios to validate:
-- Import/export functionality
-- Geometry recognition
-- Feature detection
-- Dimension extraction
-- Plan generation accuracy
-
-## Automated Testing
-
-For CI/CD pipelines where manual STEP file creation isn't feasible,
-the JSON metadata files serve as lightweight substitutes that contain
-all the geometric information needed for plan validation testing.
-"""
+    return (_ASSETS_DIR / "step_instructions.md").read_text(encoding="utf-8")
 
 
 def create_ci_test_data() -> Dict:
@@ -363,97 +302,92 @@ def create_ci_test_data() -> Dict:
     }
 
 
+def _encode_compact(obj) -> bytes:
+    """Encode a value as compact JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), default=_json_default).encode()
+
+
+def write_json_sections(path: Path, sections: Dict) -> None:
+    """Write a top-level dict as compact JSON, encoding one section at a time.
+
+    Only one section's encoded bytes are held in memory at once, instead of
+    the whole document. The file content matches a single compact dump.
+    """
+    with open(path, 'wb') as f:
+        f.write(b"{")
+        for i, (key, value) in enumerate(sections.items()):
+            if i:
+                f.write(b",")
+            f.write(_encode_compact(key))
+            f.write(b":")
+            f.write(_encode_compact(value))
+        f.write(b"}")
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="Generate test fixtures for Fusion 360 Co-Pilot")
     parser.add_argument("--output-dir", default="fixtures", help="Output directory for fixtures")
     parser.add_argument("--format", choices=["json", "instructions", "both"], default="both", 
                        help="Output format")
+    parser.add_argument("--pretty", action="store_true",
+                       help="Indent JSON output (default is compact, for CI)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format="%(message)s")
     
     # Create output directory
     output_dir = Path(args.output_dir)
-    output_dir.mkdir(exist_ok=True)
+    os.makedirs(output_dir, exist_ok=True)
     
-    if args.verbose:
-        print(f"Generating test fixtures in: {output_dir}")
+    logger.info("Generating test fixtures in: %s", output_dir)
     
     # Generate fixture metadata
     if args.format in ["json", "both"]:
+        total = _TOTAL_FIXTURES
         all_fixtures = {
             "basic_fixtures": generate_basic_fixtures(),
             "complex_fixtures": generate_complex_fixtures(), 
             "assembly_fixtures": generate_assembly_fixtures(),
             "ci_test_data": create_ci_test_data(),
             "metadata": {
-                "generated_at": datetime.utcnow().isoformat() + "Z",
+                "generated_at": _now(),
                 "version": "1.0.0",
                 "description": "Test fixtures for Fusion 360 Co-Pilot development",
-                "total_fixtures": 0  # Will be calculated
+                "total_fixtures": total
             }
         }
         
-        # Calculate total fixtures
-        total = (len(all_fixtures["basic_fixtures"]) + 
-                len(all_fixtures["complex_fixtures"]) +
-                len(all_fixtures["assembly_fixtures"]))
-        all_fixtures["metadata"]["total_fixtures"] = total
-        
         # Write JSON file
         json_file = output_dir / "test_fixtures.json"
-        with open(json_file, 'w') as f:
-            json.dump(all_fixtures, f, indent=2)
+        if args.pretty:
+            if ORJSON_AVAILABLE:
+                json_file.write_bytes(orjson.dumps(all_fixtures, option=orjson.OPT_INDENT_2))
+            else:
+                # Encode in one call and write once; json.dump() issues a write per chunk
+                json_file.write_text(json.dumps(all_fixtures, indent=2, default=_json_default))
+        else:
+            write_json_sections(json_file, all_fixtures)
         
-        if args.verbose:
-            print(f"Generated JSON fixtures: {json_file} ({total} fixtures)")
+        logger.info("Generated JSON fixtures: %s (%d fixtures)", json_file, total)
     
     # Generate instructions
     if args.format in ["instructions", "both"]:
         instructions_file = output_dir / "STEP_creation_instructions.md"
-        with open(instructions_file, 'w') as f:
-            f.write(generate_step_file_instructions())
+        instructions_file.write_bytes((_ASSETS_DIR / "step_instructions.md").read_bytes())
         
-        if args.verbose:
-            print(f"Generated instructions: {instructions_file}")
+        logger.info("Generated instructions: %s", instructions_file)
     
     # Create a simple README
     readme_file = output_dir / "README.md"
-    with open(readme_file, 'w') as f:
-        f.write("""# Test Fixtures
-
-This directory contains test fixtures for the Fusion 360 Co-Pilot development.
-
-## Contents
-
-- `test_fixtures.json` - Metadata for all test fixtures
-- `STEP_creation_instructions.md` - Instructions for creating actual STEP files
-- `README.md` - This file
-
-## Usage
-
-### For Development
-Use the JSON metadata for lightweight testing without requiring actual CAD files.
-
-### For Full Testing  
-Follow the instructions to create actual STEP files in Fusion 360, then place them in this directory.
-
-### For CI/CD
-The CI test data in the JSON file provides validation scenarios that can run without CAD software.
-
-## File Naming Convention
-
-- Simple fixtures: `{name}.step` (e.g., `simple_plate.step`)
-- Complex fixtures: `{name}.step` (e.g., `mounting_plate_4holes.step`)
-- Metadata: `{name}_metadata.json` (optional, for additional data)
-
-Generated by: Fusion 360 Co-Pilot Test Fixture Generator
-""")
+    readme_file.write_bytes((_ASSETS_DIR / "README.md").read_bytes())
     
-    if args.verbose:
-        print(f"Generated README: {readme_file}")
-        print("Test fixture generation complete!")
+    logger.info("Generated README: %s", readme_file)
+    logger.info("Test fixture generation complete!")
     
     print(f"Test fixtures generated in: {output_dir}")
     print("Run 'python generate_test_fixtures.py --help' for more options")
@@ -14,17 +14,47 @@ License: MIT
 
 import asyncio
 import aiohttp
+import gzip
 import time
 import json
+import math
+import random
 import statistics
 import argparse
 import sys
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from array import array
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 import concurrent.futures
+from functools import lru_cache
 from pathlib import Path
 
+# Optional fast JSON encoder; falls back to the stdlib encoder when missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Optional numpy for selection-based percentiles; falls back to sorting
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Optional libuv-based event loop (Linux/macOS only); falls back to asyncio's default
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "fusion_addin"))
 
@@ -37,7 +67,54 @@ except ImportError:
     print("Warning: Co-Pilot modules not available, using mock implementations")
 
 
-@dataclass
+def _dumps_bytes(obj: Any) -> bytes:
+    """Encode obj as compact JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _json_size(obj: Any) -> int:
+    """Return the size in bytes of the JSON encoding of obj."""
+    return len(_dumps_bytes(obj))
+
+
+def _encode_request(prompt: str) -> bytes:
+    """Encode the LLM request body for a prompt."""
+    payload = {
+        "prompt": prompt,
+        "context": {
+            "units": "mm",
+            "max_operations": 50
+        }
+    }
+    return _dumps_bytes(payload)
+
+
+# aiohttp only decodes brotli responses when a brotli package is installed
+try:
+    import brotli
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+_JSON_HEADERS = {"Content-Type": "application/json", "Accept-Encoding": _ACCEPT_ENCODING}
+_GZIP_JSON_HEADERS = {**_JSON_HEADERS, "Content-Encoding": "gzip"}
+
+# Request bodies smaller than this aren't worth compressing
+_GZIP_MIN_BYTES = 1024
+
+
+@lru_cache(maxsize=64)
+def _gzip_body(payload: bytes) -> bytes:
+    """Gzip a request body; level 1 is close to memcpy speed. Cached per body."""
+    return gzip.compress(payload, compresslevel=1)
+
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+@dataclass(slots=True)
 class LoadTestResult:
     """Result of a single load test operation."""
     test_name: str
@@ -45,12 +122,69 @@ class LoadTestResult:
     end_time: float
     success: bool
     error: Optional[str] = None
+    error_type: Optional[str] = None
     response_size: int = 0
     operations_count: int = 0
+    # Measured with time.perf_counter(); start/end times are wall clock for logs
+    duration: float = 0.0
+
+
+class ResultStats:
+    """Running aggregates over load test results.
+    
+    Updated as each result arrives so reporting doesn't need to keep or
+    re-scan every LoadTestResult. Successful durations are kept in a
+    compact float array because median and percentiles need the samples.
+    """
+    
+    def __init__(self):
+        self.total = 0
+        self.failed = 0
+        self.durations = array('d')
+        self.duration_sum = 0.0
+        self.ops_min = 0
+        self.ops_max = 0
+        self.ops_sum = 0
+        self.size_min = 0
+        self.size_max = 0
+        self.size_sum = 0
+        self.complex_count = 0
+        self.complex_duration_sum = 0.0
+        self.errors: Counter = Counter()
     
     @property
-    def duration(self) -> float:
-        return self.end_time - self.start_time
+    def successful(self) -> int:
+        return self.total - self.failed
+    
+    def add(self, result: LoadTestResult) -> None:
+        """Fold a single result into the aggregates."""
+        self.total += 1
+        
+        if not result.success:
+            self.failed += 1
+            self.errors[result.error_type or "Unknown"] += 1
+            return
+        
+        first = not self.durations
+        self.durations.append(result.duration)
+        self.duration_sum += result.duration
+        
+        ops = result.operations_count
+        size = result.response_size
+        if first:
+            self.ops_min = self.ops_max = ops
+            self.size_min = self.size_max = size
+        else:
+            self.ops_min = min(self.ops_min, ops)
+            self.ops_max = max(self.ops_max, ops)
+            self.size_min = min(self.size_min, size)
+            self.size_max = max(self.size_max, size)
+        self.ops_sum += ops
+        self.size_sum += size
+        
+        if ops > 10:
+            self.complex_count += 1
+            self.complex_duration_sum += result.duration
 
 
 class ComplexOperationGenerator:
@@ -108,14 +242,21 @@ class ComplexOperationGenerator:
             }
         ]
     
+        # Request bodies are fixed per template, so encode them once up front
+        for op in self.operation_templates:
+            op["_payload_bytes"] = _encode_request(op["prompt"])
+        
+        # Templates grouped by complexity so get_operation() needn't filter per call
+        self._by_complexity: Dict[str, List[Dict[str, Any]]] = {}
+        for op in self.operation_templates:
+            self._by_complexity.setdefault(op["complexity"], []).append(op)
+    
     def get_operation(self, complexity: str = None) -> Dict[str, Any]:
         """Get a random operation, optionally filtered by complexity."""
         if complexity:
-            filtered = [op for op in self.operation_templates if op["complexity"] == complexity]
-            import random
+            filtered = self._by_complexity.get(complexity)
             return random.choice(filtered) if filtered else self.operation_templates[0]
         
-        import random
         return random.choice(self.operation_templates)
     
     def get_all_operations(self) -> List[Dict[str, Any]]:
@@ -126,11 +267,40 @@ class ComplexOperationGenerator:
 class LoadTester:
     """Comprehensive load testing framework for Fusion 360 Co-Pilot."""
     
-    def __init__(self, endpoint: str = "http://localhost:8080/llm", verbose: bool = False):
+    # Flush the results log every this many results to bound loss on a crash
+    RESULTS_LOG_FLUSH_EVERY = 100
+    
+    def __init__(self, endpoint: str = "http://localhost:8080/llm", verbose: bool = False,
+                 io_depth: int = 8, results_log: Optional[str] = None,
+                 connect_timeout: float = 5.0, read_timeout: float = 30.0,
+                 think_time: Tuple[float, float] = (0.0, 0.0), gzip_requests: bool = False):
         self.endpoint = endpoint
         self.verbose = verbose
+        self.io_depth = max(1, io_depth)
+        # Only enable when the endpoint accepts Content-Encoding: gzip
+        self.gzip_requests = gzip_requests
+        
+        # Pause between a user's requests; (0, 0) runs closed-loop at full speed
+        self._think_min, self._think_max = think_time
+        
+        # Per-phase timeouts; a total timeout would also count time spent
+        # queued for a pooled connection and flag healthy requests as failed
+        self.timeout = aiohttp.ClientTimeout(
+            total=None,
+            connect=connect_timeout,
+            sock_connect=connect_timeout,
+            sock_read=read_timeout
+        )
+        
+        # Optional JSONL log with one line per result, written as results arrive
+        self._results_log = open(results_log, 'wb') if results_log else None
+        self._results_logged = 0
+        self.stats = ResultStats()
+        # Individual results are only kept for verbose runs
         self.results: List[LoadTestResult] = []
         self.operation_generator = ComplexOperationGenerator()
+        # Realistic usage mix: 60% simple, 30% medium, 10% complex
+        self._complexity_pool = ["low"] * 6 + ["medium"] * 3 + ["high"]
         
         # Performance tracking
         self.start_time = None
@@ -150,19 +320,47 @@ class LoadTester:
             self.sanitizer = None
             self.executor = None
     
+    def _create_session(self, concurrent_users: int) -> aiohttp.ClientSession:
+        """Create the HTTP session shared by simulated users.
+        
+        Sized so each of a user's ``io_depth`` in-flight requests gets its
+        own keep-alive connection; otherwise pipelined requests wait for a
+        pooled connection and that wait is measured as latency. aiohttp is
+        used rather than httpx because it holds up better with many
+        concurrent LLM requests.
+        """
+        connections = concurrent_users * self.io_depth
+        connector = aiohttp.TCPConnector(
+            limit=connections * 2,
+            limit_per_host=connections,
+            keepalive_timeout=60,
+            ttl_dns_cache=300
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.timeout
+        )
+    
     async def send_llm_request(self, prompt: str, session: aiohttp.ClientSession) -> Dict[str, Any]:
-        """Send a request to the LLM endpoint."""
-        payload = {
-            "prompt": prompt,
-            "context": {
-                "units": "mm",
-                "max_operations": 50
-            }
-        }
+        """Send an ad-hoc prompt to the LLM endpoint."""
+        return await self._post_request(_encode_request(prompt), session)
+    
+    async def send_operation_request(self, operation: Dict[str, Any],
+                                     session: aiohttp.ClientSession) -> Dict[str, Any]:
+        """Send an operation template's prompt, reusing its pre-encoded body."""
+        payload = operation.get("_payload_bytes") or _encode_request(operation["prompt"])
+        return await self._post_request(payload, session)
+    
+    async def _post_request(self, payload: bytes, session: aiohttp.ClientSession) -> Dict[str, Any]:
+        """POST an encoded request body and decode the JSON response."""
+        if self.gzip_requests and len(payload) > _GZIP_MIN_BYTES:
+            data, headers = _gzip_body(payload), _GZIP_JSON_HEADERS
+        else:
+            data, headers = payload, _JSON_HEADERS
         
-        async with session.post(self.endpoint, json=payload) as response:
+        async with session.post(self.endpoint, data=data, headers=headers) as response:
             if response.status == 200:
-                return await response.json()
+                return await response.json(loads=_json_loads)
             else:
                 raise Exception(f"HTTP {response.status}: {await response.text()}")
     
@@ -200,10 +398,11 @@ class LoadTester:
     async def run_single_test(self, operation: Dict[str, Any], session: aiohttp.ClientSession) -> LoadTestResult:
         """Run a single load test operation."""
         start_time = time.time()
+        t0 = time.perf_counter()
         
         try:
             # Send LLM request
-            response = await self.send_llm_request(operation["prompt"], session)
+            response = await self.send_operation_request(operation, session)
             
             # Validate response
             if not self.validate_plan(response):
@@ -213,6 +412,7 @@ class LoadTester:
             if not self.simulate_execution(response):
                 raise Exception("Plan execution simulation failed")
             
+            duration = time.perf_counter() - t0
             end_time = time.time()
             
             return LoadTestResult(
@@ -220,11 +420,13 @@ class LoadTester:
                 start_time=start_time,
                 end_time=end_time,
                 success=True,
-                response_size=len(json.dumps(response)),
-                operations_count=len(response.get("operations", []))
+                response_size=_json_size(response),
+                operations_count=len(response.get("operations", [])),
+                duration=duration
             )
             
         except Exception as e:
+            duration = time.perf_counter() - t0
             end_time = time.time()
             
             return LoadTestResult(
@@ -232,7 +434,9 @@ class LoadTester:
                 start_time=start_time,
                 end_time=end_time,
                 success=False,
-                error=str(e)
+                error=str(e),
+                error_type=type(e).__name__,
+                duration=duration
             )
     
     async def run_concurrent_test(self, concurrent_users: int = 5, duration: int = 60):
@@ -242,7 +446,7 @@ class LoadTester:
         self.start_time = time.time()
         end_time = self.start_time + duration
         
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+        async with self._create_session(concurrent_users) as session:
             tasks = []
             
             # Create concurrent user tasks
@@ -256,36 +460,67 @@ class LoadTester:
         self.end_time = time.time()
     
     async def run_user_simulation(self, user_id: int, end_time: float, session: aiohttp.ClientSession):
-        """Simulate a single user's load testing session."""
-        user_results = []
+        """Simulate a single user's load testing session.
+        
+        Each user keeps up to ``io_depth`` requests in flight, so slow
+        responses don't throttle how much load the user generates.
+        """
+        pending = set()
         
         while time.time() < end_time:
             # Select operation based on realistic usage patterns
-            # 60% simple, 30% medium, 10% complex
-            import random
-            rand = random.random()
-            if rand < 0.6:
-                operation = self.operation_generator.get_operation("low")
-            elif rand < 0.9:
-                operation = self.operation_generator.get_operation("medium")
-            else:
-                operation = self.operation_generator.get_operation("high")
+            operation = self.operation_generator.get_operation(random.choice(self._complexity_pool))
             
             # Add user context to operation name
             operation = operation.copy()
             operation["name"] = f"user{user_id}_{operation['name']}"
             
-            # Run the test
-            result = await self.run_single_test(operation, session)
-            user_results.append(result)
+            # Submit the test; block only once the pipeline is full
+            pending.add(asyncio.create_task(self.run_single_test(operation, session)))
+            if len(pending) >= self.io_depth:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                self._record_results(done)
+            
+            # Optional think time between operations (realistic user behavior)
+            if self._think_max > 0:
+                await asyncio.sleep(random.uniform(self._think_min, self._think_max))
+            
+            done = {task for task in pending if task.done()}
+            pending -= done
+            self._record_results(done)
+        
+        # Drain requests still in flight when the time window closed
+        if pending:
+            done, _ = await asyncio.wait(pending)
+            self._record_results(done)
+    
+    def _record(self, result: LoadTestResult) -> None:
+        """Add a result to the running stats and the results log."""
+        self.stats.add(result)
+        if self.verbose:
             self.results.append(result)
+        
+        if self._results_log:
+            self._results_log.write(_dumps_bytes(asdict(result)) + b"\n")
+            self._results_logged += 1
+            if self._results_logged % self.RESULTS_LOG_FLUSH_EVERY == 0:
+                self._results_log.flush()
+    
+    def close(self) -> None:
+        """Flush and close the results log, if one is open."""
+        if self._results_log:
+            self._results_log.close()
+            self._results_log = None
+    
+    def _record_results(self, tasks) -> None:
+        """Store results from finished run_single_test tasks."""
+        for task in tasks:
+            result = task.result()
+            self._record(result)
             
             if self.verbose:
                 status = "✅" if result.success else "❌"
                 print(f"{status} {result.test_name}: {result.duration:.2f}s")
-            
-            # Small delay between operations (realistic user behavior)
-            await asyncio.sleep(random.uniform(1, 3))
     
     async def run_stress_test(self, max_concurrent: int = 20, ramp_up_time: int = 30):
         """Run stress test with gradually increasing load."""
@@ -293,7 +528,7 @@ class LoadTester:
         
         self.start_time = time.time()
         
-        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+        async with self._create_session(max_concurrent) as session:
             tasks = []
             
             # Gradual ramp up
@@ -315,62 +550,29 @@ class LoadTester:
         end_time = time.time() + 60
         await self.run_user_simulation(user_id, end_time, session)
     
-    def run_sequential_test(self):
-        """Run sequential test of all operation types."""
+    async def run_sequential_test(self, serial: bool = False):
+        """Run a sanity test of every operation type.
+        
+        The operations are independent, so they are sent concurrently unless
+        ``serial`` is set; results are recorded in template order either way.
+        """
         print("📋 Running sequential test of all operations...")
         
         self.start_time = time.time()
+        operations = self.operation_generator.get_all_operations()
         
-        # Use sync session for sequential testing
-        import requests
-        
-        for operation in self.operation_generator.get_all_operations():
-            start_time = time.time()
-            
-            try:
-                # Send request
-                payload = {
-                    "prompt": operation["prompt"],
-                    "context": {
-                        "units": "mm",
-                        "max_operations": 50
-                    }
-                }
-                
-                response = requests.post(self.endpoint, json=payload, timeout=30)
-                response.raise_for_status()
-                plan = response.json()
-                
-                # Validate and simulate execution
-                if not self.validate_plan(plan):
-                    raise Exception("Plan validation failed")
-                
-                if not self.simulate_execution(plan):
-                    raise Exception("Plan execution simulation failed")
-                
-                end_time = time.time()
-                
-                result = LoadTestResult(
-                    test_name=operation["name"],
-                    start_time=start_time,
-                    end_time=end_time,
-                    success=True,
-                    response_size=len(json.dumps(plan)),
-                    operations_count=len(plan.get("operations", []))
-                )
-                
-            except Exception as e:
-                end_time = time.time()
-                
-                result = LoadTestResult(
-                    test_name=operation["name"],
-                    start_time=start_time,
-                    end_time=end_time,
-                    success=False,
-                    error=str(e)
+        async with self._create_session(1 if serial else len(operations)) as session:
+            if serial:
+                results = []
+                for operation in operations:
+                    results.append(await self.run_single_test(operation, session))
+            else:
+                results = await asyncio.gather(
+                    *(self.run_single_test(operation, session) for operation in operations)
                 )
-            
-            self.results.append(result)
+        
+        for result in results:
+            self._record(result)
             
             if self.verbose:
                 status = "✅" if result.success else "❌"
@@ -380,85 +582,101 @@ class LoadTester:
     
     def generate_report(self) -> Dict[str, Any]:
         """Generate comprehensive load test report."""
-        if not self.results:
+        stats = self.stats
+        if not stats.total:
             return {"error": "No test results available"}
         
-        # Calculate statistics
-        successful_results = [r for r in self.results if r.success]
-        failed_results = [r for r in self.results if not r.success]
-        
-        durations = [r.duration for r in successful_results]
-        operation_counts = [r.operations_count for r in successful_results]
-        response_sizes = [r.response_size for r in successful_results]
+        durations = stats.durations
+        successful = stats.successful
         
         # Performance metrics
         total_duration = self.end_time - self.start_time if self.start_time and self.end_time else 0
-        requests_per_second = len(self.results) / total_duration if total_duration > 0 else 0
-        
-        # Error analysis
-        error_summary = {}
-        for result in failed_results:
-            error_type = type(Exception(result.error)).__name__ if result.error else "Unknown"
-            error_summary[error_type] = error_summary.get(error_type, 0) + 1
+        requests_per_second = stats.total / total_duration if total_duration > 0 else 0
+        
+        if NUMPY_AVAILABLE and durations:
+            # Zero-copy view over the float array; reductions run in C
+            d = np.frombuffer(durations, dtype=np.float64)
+            min_duration, max_duration = float(d.min()), float(d.max())
+            # One partition places the middle pair and the tail ranks together
+            n = d.size
+            lower, upper = (n - 1) // 2, n // 2
+            ranks = [self._rank_index(n, 95), self._rank_index(n, 99)]
+            partitioned = np.partition(d, [lower, upper] + ranks)
+            median_duration = 0.5 * float(partitioned[lower] + partitioned[upper])
+            p95, p99 = (float(partitioned[i]) for i in ranks)
+        elif durations:
+            # Sort once and read every order statistic from the same list
+            sorted_durations = sorted(durations)
+            min_duration, max_duration = sorted_durations[0], sorted_durations[-1]
+            median_duration = statistics.median(sorted_durations)
+            p95 = self._percentile_sorted(sorted_durations, 95)
+            p99 = self._percentile_sorted(sorted_durations, 99)
+        else:
+            min_duration = max_duration = median_duration = p95 = p99 = 0
         
         report = {
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "test_configuration": {
                 "endpoint": self.endpoint,
                 "total_duration": total_duration,
-                "modules_available": MODULES_AVAILABLE
+                "modules_available": MODULES_AVAILABLE,
+                "mode": "session_simulation" if self._think_max > 0 else "closed_loop",
+                "think_time": [self._think_min, self._think_max]
             },
             "summary": {
-                "total_requests": len(self.results),
-                "successful_requests": len(successful_results),
-                "failed_requests": len(failed_results),
-                "success_rate": len(successful_results) / len(self.results) * 100,
+                "total_requests": stats.total,
+                "successful_requests": successful,
+                "failed_requests": stats.failed,
+                "success_rate": successful / stats.total * 100,
                 "requests_per_second": requests_per_second
             },
             "performance": {
                 "response_times": {
-                    "min": min(durations) if durations else 0,
-                    "max": max(durations) if durations else 0,
-                    "mean": statistics.mean(durations) if durations else 0,
-                    "median": statistics.median(durations) if durations else 0,
-                    "p95": self._percentile(durations, 95) if durations else 0,
-                    "p99": self._percentile(durations, 99) if durations else 0
+                    "min": min_duration,
+                    "max": max_duration,
+                    "mean": stats.duration_sum / successful if successful else 0,
+                    "median": median_duration,
+                    "p95": p95,
+                    "p99": p99
                 },
                 "operations_per_request": {
-                    "min": min(operation_counts) if operation_counts else 0,
-                    "max": max(operation_counts) if operation_counts else 0,
-                    "mean": statistics.mean(operation_counts) if operation_counts else 0
+                    "min": stats.ops_min,
+                    "max": stats.ops_max,
+                    "mean": stats.ops_sum / successful if successful else 0
                 },
                 "response_sizes": {
-                    "min": min(response_sizes) if response_sizes else 0,
-                    "max": max(response_sizes) if response_sizes else 0,
-                    "mean": statistics.mean(response_sizes) if response_sizes else 0
+                    "min": stats.size_min,
+                    "max": stats.size_max,
+                    "mean": stats.size_sum / successful if successful else 0
                 }
             },
-            "errors": error_summary,
-            "recommendations": self._get_performance_recommendations(successful_results, failed_results)
+            "errors": dict(stats.errors),
+            "recommendations": self._get_performance_recommendations(stats)
         }
         
         return report
     
-    def _percentile(self, data: List[float], percentile: int) -> float:
-        """Calculate percentile of data."""
-        if not data:
+    @staticmethod
+    def _rank_index(n: int, percentile: int) -> int:
+        """Index of the nearest-rank percentile in n sorted samples."""
+        return min(max(math.ceil((percentile / 100) * n) - 1, 0), n - 1)
+    
+    def _percentile_sorted(self, sorted_data: List[float], percentile: int) -> float:
+        """Calculate percentile of data that is already sorted."""
+        if not sorted_data:
             return 0
-        sorted_data = sorted(data)
-        index = int((percentile / 100) * len(sorted_data))
-        return sorted_data[min(index, len(sorted_data) - 1)]
+        return sorted_data[self._rank_index(len(sorted_data), percentile)]
     
-    def _get_performance_recommendations(self, successful: List[LoadTestResult], failed: List[LoadTestResult]) -> List[str]:
+    def _get_performance_recommendations(self, stats: ResultStats) -> List[str]:
         """Generate performance recommendations based on test results."""
         recommendations = []
         
-        if successful:
-            avg_duration = statistics.mean([r.duration for r in successful])
+        if stats.successful:
+            avg_duration = stats.duration_sum / stats.successful
             if avg_duration > 5.0:
                 recommendations.append("Response times are high (>5s). Consider optimizing LLM requests or caching.")
         
-        failure_rate = len(failed) / (len(successful) + len(failed)) * 100 if (successful or failed) else 0
+        failure_rate = stats.failed / stats.total * 100 if stats.total else 0
         if failure_rate > 10:
             recommendations.append(f"High failure rate ({failure_rate:.1f}%). Review error handling and retry logic.")
         
@@ -466,9 +684,8 @@ class LoadTester:
             recommendations.append("Critical failure rate. System may not be ready for production load.")
         
         # Operation complexity analysis
-        complex_ops = [r for r in successful if r.operations_count > 10]
-        if complex_ops:
-            avg_complex_duration = statistics.mean([r.duration for r in complex_ops])
+        if stats.complex_count:
+            avg_complex_duration = stats.complex_duration_sum / stats.complex_count
             if avg_complex_duration > 10:
                 recommendations.append("Complex operations (>10 ops) are slow. Consider operation batching or async processing.")
         
@@ -478,6 +695,17 @@ class LoadTester:
         return recommendations
 
 
+def _parse_think_time(value: str) -> Tuple[float, float]:
+    """Parse a MIN,MAX think-time range for argparse."""
+    try:
+        low, high = (float(part) for part in value.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected MIN,MAX seconds, got '{value}'")
+    if low < 0 or high < low:
+        raise argparse.ArgumentTypeError(f"invalid think-time range '{value}'")
+    return (low, high)
+
+
 async def main():
     """Main entry point for load testing."""
     parser = argparse.ArgumentParser(description='Fusion 360 Co-Pilot Load Testing')
@@ -485,8 +713,17 @@ async def main():
     parser.add_argument('--concurrent', type=int, default=5, help='Number of concurrent users')
     parser.add_argument('--duration', type=int, default=60, help='Test duration in seconds')
     parser.add_argument('--test-type', choices=['concurrent', 'stress', 'sequential'], default='concurrent', help='Type of load test')
+    parser.add_argument('--io-depth', type=int, default=8, help='Max in-flight requests per simulated user')
+    parser.add_argument('--think-time', type=_parse_think_time, default=(0.0, 0.0), metavar='MIN,MAX',
+                        help='Random pause between a user\'s requests in seconds (e.g. 1,3); default 0 runs at full speed')
+    parser.add_argument('--connect-timeout', type=float, default=5.0, help='Connection timeout in seconds')
+    parser.add_argument('--read-timeout', type=float, default=30.0, help='Response read timeout in seconds')
+    parser.add_argument('--gzip-requests', action='store_true',
+                        help='Gzip request bodies over 1 KB (endpoint must accept Content-Encoding: gzip)')
+    parser.add_argument('--serial', action='store_true', help='Send sequential-test operations one at a time')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--output', '-o', help='Output report to file (JSON)')
+    parser.add_argument('--results-log', help='Append each result to this file as JSON lines')
     
     args = parser.parse_args()
     
@@ -496,16 +733,18 @@ async def main():
     print(f"=" * 60)
     
     # Initialize load tester
-    tester = LoadTester(args.endpoint, args.verbose)
+    tester = LoadTester(args.endpoint, args.verbose, args.io_depth, args.results_log,
+                        args.connect_timeout, args.read_timeout, args.think_time,
+                        args.gzip_requests)
     
     # Check endpoint availability
     try:
-        import requests
-        response = requests.get(args.endpoint.replace('/llm', '/health'), timeout=5)
-        if response.status_code == 200:
-            print("✅ Endpoint is reachable")
-        else:
-            print("⚠️ Endpoint returned non-200 status")
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5)) as session:
+            async with session.get(args.endpoint.replace('/llm', '/health')) as response:
+                if response.status == 200:
+                    print("✅ Endpoint is reachable")
+                else:
+                    print("⚠️ Endpoint returned non-200 status")
     except Exception as e:
         print(f"⚠️ Could not verify endpoint: {e}")
         print("Continuing with load test...")
@@ -517,7 +756,7 @@ async def main():
         elif args.test_type == 'stress':
             await tester.run_stress_test(args.concurrent, args.duration)
         else:  # sequential
-            tester.run_sequential_test()
+            await tester.run_sequential_test(args.serial)
         
         print(f"\n✅ Load testing completed")
         
@@ -526,6 +765,8 @@ async def main():
     except Exception as e:
         print(f"\n❌ Load testing failed: {e}")
         return 1
+    finally:
+        tester.close()
     
     # Generate and display report
     report = tester.generate_report()
@@ -550,8 +791,10 @@ async def main():
     
     # Save report if requested
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(report, f, indent=2)
+        if ORJSON_AVAILABLE:
+            Path(args.output).write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            Path(args.output).write_text(json.dumps(report, indent=2))
         print(f"\n📄 Report saved to: {args.output}")
     
     # Return appropriate exit code
@@ -567,5 +810,16 @@ async def main():
         return 0
 
 
+def run_event_loop(coro):
+    """Run a coroutine to completion, on uvloop when it is installed."""
+    if not UVLOOP_AVAILABLE:
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
+
+
 if __name__ == '__main__':
-    sys.exit(asyncio.run(main()))
\ No newline at end of file
+    sys.exit(run_event_loop(main()))
\ No newline at end of file
@@ -14,10 +14,15 @@ License: MIT
 
 import os
 import re
+import ast
+import mmap
 import json
 import sys
 import argparse
-from typing import List, Dict, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from itertools import chain
+from typing import List, Dict, Tuple, Any, Iterator, Optional, Set
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -29,16 +34,474 @@ try:
 except ImportError:
     ENV_CONFIG_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+ENGINES = ('re', 're2', 'hyperscan')
+
+
+# Patterns that indicate potential secrets
+SECRET_PATTERNS = [
+    (r'api[_-]?key\s*[=:]\s*["\'][^"\']{20,}["\']', 'API key'),
+    (r'password\s*[=:]\s*["\'][^"\']+["\']', 'Password'),
+    (r'secret\s*[=:]\s*["\'][^"\']{10,}["\']', 'Secret'),
+    (r'token\s*[=:]\s*["\'][^"\']{20,}["\']', 'Token'),
+    (r'sk-[A-Za-z0-9]{20,}', 'OpenAI API key'),
+    (r'xoxb-[0-9]{10,}-[0-9]{10,}-[A-Za-z0-9]{20,}', 'Slack token'),
+]
+
+# Kept apart from SECRET_PATTERNS because it has no literal keyword to prefilter on
+UUID_PATTERN = r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+
+HTTP_PATTERN = r'http://[^\s"\']*'
+
+SSL_DISABLE_PATTERNS = [
+    r'verify\s*=\s*False',
+    r'ssl_verify\s*=\s*False',
+    r'CERT_NONE',
+]
+
+# Builtins that execute or import arbitrary code. Python files are checked
+# for direct calls via the AST; the regex (group(1) names the function) is the
+# fallback for files that do not parse.
+DANGEROUS_FUNCTIONS = frozenset({'eval', 'exec', 'compile', '__import__'})
+DANGEROUS_FUNCTION_PATTERN = r'\b(eval|exec|compile|__import__)\s*\('
+
+SQL_PATTERNS = [
+    r'\.format\s*\([^)]*\+[^)]*\)',
+    r'%\s*\([^)]*\+[^)]*\)',
+    r'"[^"]*\+[^"]*"',
+]
+
+SENSITIVE_LOG_PATTERNS = [
+    r'log[^(]*\([^)]*password[^)]*\)',
+    r'log[^(]*\([^)]*api_key[^)]*\)',
+    r'log[^(]*\([^)]*secret[^)]*\)',
+    r'log[^(]*\([^)]*token[^)]*\)',
+    r'print\([^)]*password[^)]*\)',
+    r'print\([^)]*api_key[^)]*\)',
+]
+
+# Matched secrets containing any of these are treated as placeholders
+PLACEHOLDERS = (
+    'your_', 'placeholder', 'example', 'dummy', 'test',
+    'fake', 'sample', 'template', 'xxx', '***',
+)
+
+
+# Pattern specs as (pattern, flags, label) tuples. They are plain data so
+# worker processes can compile their own copies instead of pickling re.Pattern.
+PATTERN_SPECS = {
+    'secrets': [(pattern, re.IGNORECASE, label) for pattern, label in SECRET_PATTERNS],
+    'uuid': [(UUID_PATTERN, re.IGNORECASE, 'UUID/GUID')],
+    'http': [(HTTP_PATTERN, 0, 'HTTP URL')],
+    'ssl_disable': [(pattern, re.IGNORECASE, 'SSL') for pattern in SSL_DISABLE_PATTERNS],
+    'dangerous_functions': [(DANGEROUS_FUNCTION_PATTERN, 0, 'Dangerous function')],
+    'sql': [(pattern, 0, 'SQL') for pattern in SQL_PATTERNS],
+    'sensitive_log': [(pattern, re.IGNORECASE, 'Logging') for pattern in SENSITIVE_LOG_PATTERNS],
+}
+
+# Lower-case literals that each pattern group needs in order to match. A file
+# whose lower-cased bytes contain none of a group's keywords skips that group.
+KEYWORD_GROUPS = {
+    b'api': ('secrets',),
+    b'password': ('secrets', 'sensitive_log'),
+    b'secret': ('secrets', 'sensitive_log'),
+    b'token': ('secrets', 'sensitive_log'),
+    b'sk-': ('secrets',),
+    b'xoxb': ('secrets',),
+    b'api_key': ('sensitive_log',),
+    b'http://': ('http',),
+    b'verify': ('ssl_disable',),
+    # Split so the SSL pattern does not match this literal in its own source
+    b'cert' + b'_none': ('ssl_disable',),
+    b'eval': ('dangerous_functions',),
+    b'exec': ('dangerous_functions',),
+    b'compile': ('dangerous_functions',),
+    b'__import__': ('dangerous_functions',),
+    b'sql': ('sql',),
+    b'query': ('sql',),
+}
+# Groups with no literal to look for always run
+UNGATED_GROUPS = frozenset({'uuid'})
+
+# Content checks run by the single file pass, keyed by file suffix
+SCANS_BY_SUFFIX = {
+    '.py': ('secrets', 'network', 'input_validation', 'logging'),
+    '.yaml': ('secrets',),
+    '.json': ('secrets',),
+}
+CHECK_NAMES = ('secrets', 'network', 'input_validation', 'logging')
+
+# Directories pruned from the walk (compared lower-cased). Test and example
+# trees hold fixtures and placeholder credentials by design.
+EXCLUDED_DIRS = {
+    'tests', 'test', 'examples', 'example',
+    '.git', '.venv', 'venv', 'node_modules', '__pycache__', 'build', 'dist', '.tox',
+}
+
+# Files that should never be readable or writable by others
+SENSITIVE_NAMES = frozenset({'.env', 'settings.yaml'})
+SENSITIVE_SUFFIXES = frozenset({'.key', '.pem', '.p12', '.pfx'})
+
+# Dependency manifests; requirements*.txt files share one bucket
+DEPENDENCY_NAMES = ('Pipfile', 'pyproject.toml')
+REQUIREMENTS_BUCKET = 'requirements*.txt'
+
+# Everything the single project walk collects, by suffix or exact name
+WANTED_SUFFIXES = frozenset(SCANS_BY_SUFFIX) | SENSITIVE_SUFFIXES
+WANTED_NAMES = SENSITIVE_NAMES | frozenset(DEPENDENCY_NAMES)
+
+# Larger files are almost always generated artifacts; skip rather than scan them
+MAX_SCAN_BYTES = 512 * 1024
+
+# Generated files that only produce UUID/hash noise
+NOISE_FILENAMES = frozenset({'package-lock.json', 'yarn.lock', 'poetry.lock'})
+NOISE_SUFFIXES = ('.min.js',)
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+
+def _decode(data: bytes) -> str:
+    """Decode matched bytes for the report."""
+    return data.decode('utf-8', 'replace')
+
+
+def _dumps_report(report: Dict[str, Any]) -> bytes:
+    """Encode the report as indented UTF-8 JSON, with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    return json.dumps(report, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def resolve_engine(requested: Optional[str] = None) -> str:
+    """
+    Pick the regex engine to scan with.
+
+    With no request, prefer linear-time RE2, then the Hyperscan prefilter,
+    then the standard library. A requested engine that is not installed
+    falls back to ``re``.
+    """
+    available = {'re': True, 're2': RE2_AVAILABLE, 'hyperscan': HYPERSCAN_AVAILABLE}
+    if requested is None:
+        return next(engine for engine in ('re2', 'hyperscan', 're') if available[engine])
+    return requested if available.get(requested) else 're'
+
+
+class FileScanner:
+    """
+    Per-file content checks, compiled once from ``PATTERN_SPECS``.
+
+    ``engine`` selects how patterns run: ``re`` (standard library), ``re2``
+    (google-re2, linear time regardless of input) or ``hyperscan`` (``re``
+    matching behind a Hyperscan prefilter).
+    """
+
+    def __init__(self, specs: Dict[str, List[Tuple[str, int, str]]], engine: str = 're'):
+        self.engine = engine
+
+        # Secret, SSL and logging patterns are each folded into one
+        # alternation so a file is scanned once per group, not once per pattern
+        self._secret_union, self._secret_labels = self._compile_union(specs['secrets'])
+        self._uuid_pattern, self._uuid_labels = self._compile_union(specs['uuid'])
+        self._ssl_disable_union, _ = self._compile_union(specs['ssl_disable'])
+        self._sensitive_log_union, _ = self._compile_union(specs['sensitive_log'])
+
+        pattern, flags, _ = specs['http'][0]
+        self._http_pattern = self._compile(pattern, flags)
+        pattern, flags, _ = specs['dangerous_functions'][0]
+        self._dangerous_function_pattern = self._compile(pattern, flags)
+        self._sql_patterns = [self._compile(pattern, flags) for pattern, flags, _ in specs['sql']]
+        self._sql_keywords = self._compile('sql|query', re.IGNORECASE)
+        self._placeholder_matcher = self._build_placeholder_matcher()
+
+        self._scanners = {
+            'secrets': self._scan_secrets,
+            'network': self._scan_network,
+            'input_validation': self._scan_input_validation,
+            'logging': self._scan_logging,
+        }
+
+        self._prefilter_db = None
+        self._prefilter_groups = []
+        if engine == 'hyperscan' and HYPERSCAN_AVAILABLE:
+            self._build_prefilter(specs)
+
+    def _compile(self, pattern: str, flags: int = 0):
+        """Compile one pattern as a bytes regex with the selected engine."""
+        if self.engine == 're2' and RE2_AVAILABLE:
+            # re2 takes no re flags; case-insensitivity goes inline
+            if flags & re.IGNORECASE:
+                pattern = f'(?i){pattern}'
+            return re2.compile(pattern.encode('utf-8'))
+        return re.compile(pattern.encode('utf-8'), flags)
+
+    def _build_prefilter(self, specs: Dict[str, List[Tuple[str, int, str]]]) -> None:
+        """
+        Compile every spec pattern into one Hyperscan database.
+
+        Hyperscan only tells us which pattern groups occur in a file; the exact
+        matches (and report text) still come from ``re`` for those groups, so
+        findings are identical with or without it. Files with no hits skip
+        ``re`` entirely.
+        """
+        expressions, ids, flags = [], [], []
+        for group, entries in specs.items():
+            for pattern, entry_flags, _ in entries:
+                hs_flags = hyperscan.HS_FLAG_SINGLEMATCH
+                if entry_flags & re.IGNORECASE:
+                    hs_flags |= hyperscan.HS_FLAG_CASELESS
+                ids.append(len(expressions))
+                expressions.append(pattern.encode('utf-8'))
+                flags.append(hs_flags)
+                self._prefilter_groups.append(group)
+
+        try:
+            db = hyperscan.Database()
+            db.compile(expressions=expressions, ids=ids, elements=len(expressions), flags=flags)
+        except Exception:
+            # Unsupported construct: fall back to plain re scanning
+            self._prefilter_groups = []
+            return
+        self._prefilter_db = db
+
+    @staticmethod
+    def _keyword_prefilter(content) -> Set[str]:
+        """
+        Return the pattern groups whose keywords appear in content.
+
+        ``bytes.lower()`` plus C-level substring searches are far cheaper than
+        running the regexes, and most files contain none of the keywords.
+        """
+        lowered = content[:].lower()
+        hits = set(UNGATED_GROUPS)
+        for keyword, groups in KEYWORD_GROUPS.items():
+            if keyword in lowered:
+                hits.update(groups)
+        return hits
+
+    def _prefilter(self, content: bytes) -> Set[str]:
+        """Return the pattern groups that may match content."""
+        if self._prefilter_db is None:
+            return self._keyword_prefilter(content)
+
+        hits = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            hits.add(self._prefilter_groups[pattern_id])
+
+        self._prefilter_db.scan(content, match_event_handler=on_match)
+        return hits
+
+    @staticmethod
+    def _build_placeholder_matcher():
+        """
+        Build a single-pass matcher for ``PLACEHOLDERS``.
+
+        Uses a pyahocorasick automaton when installed, otherwise one escaped
+        alternation regex; either way a hit needs one scan, not one per keyword.
+        """
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for placeholder in PLACEHOLDERS:
+                automaton.add_word(placeholder, placeholder)
+            automaton.make_automaton()
+            return automaton
+        return re.compile('|'.join(re.escape(placeholder) for placeholder in PLACEHOLDERS))
+
+    def _is_placeholder(self, text: str) -> bool:
+        """Check whether lower-cased matched text contains any placeholder."""
+        if AHOCORASICK_AVAILABLE:
+            return next(self._placeholder_matcher.iter(text), None) is not None
+        return self._placeholder_matcher.search(text) is not None
+
+    def _compile_union(self, entries: List[Tuple[str, int, str]]) -> Tuple[Any, List[str]]:
+        """
+        Compile specs into one named-group alternation.
+
+        ``match.lastindex - 1`` indexes the returned labels, since exactly one
+        alternative (and none of the spec patterns has groups of its own) matches.
+        """
+        flags = 0
+        for _, entry_flags, _ in entries:
+            flags |= entry_flags
+        union = '|'.join(f'(?P<p{i}>{pattern})' for i, (pattern, _, _) in enumerate(entries))
+        return self._compile(union, flags), [label for _, _, label in entries]
+
+    def scan_file(self, file_path: str, checks: Tuple[str, ...]) -> List[Tuple[str, str, str]]:
+        """
+        Map one file and run the given checks over its raw bytes.
+
+        Returns:
+            List of ``(check, level, message)`` findings
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        return self._scan_content(file_path, content, checks)
+                except ValueError:
+                    # mmap rejects empty files
+                    return self._scan_content(file_path, f.read(), checks)
+        except Exception as e:
+            return [(checks[0], 'WARNING', f"Could not scan file: {e}")]
+
+    def _scan_content(self, file_path: str, content, checks: Tuple[str, ...]) -> List[Tuple[str, str, str]]:
+        """Run the given checks over file content (bytes or a read-only mmap)."""
+        hits = self._prefilter(content)
+        if not hits:
+            return []
+
+        findings = []
+        for check in checks:
+            for level, message in self._scanners[check](file_path, content, hits):
+                findings.append((check, level, message))
+        return findings
+
+    def _scan_secrets(self, file_path: str, content: bytes,
+                      hits: Set[str]) -> Iterator[Tuple[str, str]]:
+        """Find hardcoded API keys, passwords, and secrets in one file."""
+        for group, pattern, labels in (('secrets', self._secret_union, self._secret_labels),
+                                       ('uuid', self._uuid_pattern, self._uuid_labels)):
+            if group not in hits:
+                continue
+
+            for match in pattern.finditer(content):
+                # Skip obvious placeholders
+                matched_text = _decode(match.group())
+                if self._is_placeholder(matched_text.lower()):
+                    continue
+
+                secret_type = labels[match.lastindex - 1]
+                yield 'ERROR', f"Potential {secret_type} found: {matched_text[:50]}..."
+
+    def _scan_network(self, file_path: str, content: bytes,
+                      hits: Set[str]) -> Iterator[Tuple[str, str]]:
+        """Find plain HTTP URLs and disabled SSL verification in one file."""
+        # Check for HTTP URLs (should be HTTPS)
+        if 'http' in hits:
+            for match in self._http_pattern.finditer(content):
+                url = _decode(match.group())
+                if 'localhost' not in url and '127.0.0.1' not in url:
+                    yield 'WARNING', f"HTTP URL found (should use HTTPS): {url}"
+
+        # Check for disabled SSL verification
+        if 'ssl_disable' not in hits:
+            return
+        for match in self._ssl_disable_union.finditer(content):
+            yield 'ERROR', f"SSL verification disabled: {_decode(match.group())}"
+
+    def _scan_input_validation(self, file_path: str, content: bytes,
+                               hits: Set[str]) -> Iterator[Tuple[str, str]]:
+        """Find dangerous builtins and SQL injection patterns in one file."""
+        # Check for dangerous functions
+        if 'dangerous_functions' in hits:
+            yield from self._scan_dangerous_calls(content)
+
+        # Check for SQL injection patterns
+        if 'sql' not in hits:
+            return
+        if not self._sql_keywords.search(content):
+            return
+        for pattern in self._sql_patterns:
+            for match in pattern.finditer(content):
+                yield 'WARNING', f"Potential SQL injection risk: {_decode(match.group())}"
+
+    def _scan_dangerous_calls(self, content: bytes) -> Iterator[Tuple[str, str]]:
+        """
+        Find direct calls to ``DANGEROUS_FUNCTIONS`` in Python source.
+
+        Walking the AST ignores comments, strings and attribute calls such as
+        ``re.compile(...)`` that the regex reports, and gives line numbers.
+        Source that does not parse falls back to the regex.
+        """
+        try:
+            tree = ast.parse(content[:])
+        except (SyntaxError, ValueError):
+            for match in self._dangerous_function_pattern.finditer(content):
+                yield 'ERROR', f"Dangerous function used: {_decode(match.group(1))}()"
+            return
+
+        calls = sorted(
+            (node.lineno, node.col_offset, node.func.id)
+            for node in ast.walk(tree)
+            if isinstance(node, ast.Call) and getattr(node.func, 'id', None) in DANGEROUS_FUNCTIONS
+        )
+        for lineno, _, name in calls:
+            yield 'ERROR', f"Dangerous function used: {name}() (line {lineno})"
+
+    def _scan_logging(self, file_path: str, content: bytes,
+                      hits: Set[str]) -> Iterator[Tuple[str, str]]:
+        """Find logging of sensitive data in one file."""
+        if 'sensitive_log' not in hits:
+            return
+        for match in self._sensitive_log_union.finditer(content):
+            yield 'WARNING', f"Potential sensitive data logging: {_decode(match.group())[:100]}"
+
+
+# Scanner owned by each pool worker, built once by _init_worker
+_worker_scanner = None
+
+
+def _init_worker(specs: Dict[str, List[Tuple[str, int, str]]], engine: str) -> None:
+    """Compile the pattern specs once per worker process."""
+    global _worker_scanner
+    _worker_scanner = FileScanner(specs, engine)
+
+
+def _scan_one_file(job: Tuple[str, str, Tuple[str, ...]]) -> Tuple[str, List[Tuple[str, str, str]]]:
+    """Scan one ``(path, rel_path, checks)`` job inside a worker process."""
+    file_path, rel_path, checks = job
+    return rel_path, _worker_scanner.scan_file(file_path, checks)
+
 
 class SecurityChecker:
     """Automated security validation for Fusion 360 Co-Pilot."""
     
-    def __init__(self, project_root: str, verbose: bool = False):
+    def __init__(self, project_root: str, verbose: bool = False, cores: int = 1,
+                 engine: Optional[str] = None):
         self.project_root = Path(project_root)
         self.verbose = verbose
+        self.cores = max(1, cores or 1)
+        self.engine = resolve_engine(engine)
         self.issues = []
         self.warnings = []
         self.info = []
+
+        self._scanner = FileScanner(PATTERN_SPECS, self.engine)
+        self._buckets = None
+        self._files = None
+        self.bytes_scanned = 0
+
+        # Recommendation triggers, counted as findings are logged
+        self._flags = {'password': 0, 'api_key': 0, 'http': 0, 'ssl': 0, 'logging': 0}
+        self._findings = None
         
     def log(self, level: str, message: str, file_path: str = None):
         """Log a security finding."""
@@ -50,8 +513,19 @@ class SecurityChecker:
         
         if level == 'ERROR':
             self.issues.append(finding)
+            lowered = message.lower()
+            if 'password' in lowered:
+                self._flags['password'] += 1
+            if 'api_key' in lowered:
+                self._flags['api_key'] += 1
+            if 'ssl' in lowered:
+                self._flags['ssl'] += 1
         elif level == 'WARNING':
             self.warnings.append(finding)
+            if 'http://' in message:
+                self._flags['http'] += 1
+            if 'logging' in message.lower():
+                self._flags['logging'] += 1
         else:
             self.info.append(finding)
             
@@ -60,151 +534,133 @@ class SecurityChecker:
             if file_path:
                 prefix += f" {file_path}"
             print(f"{prefix}: {message}")
-    
+
+    def _enumerate_once(self) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Walk the project a single time and bucket every file any check needs.
+
+        Uses ``os.walk`` so only wanted files are turned into strings, and
+        prunes ``EXCLUDED_DIRS`` instead of descending into them. The relative
+        path is sliced off the walk's own prefix once per directory.
+
+        Returns:
+            Dict mapping a suffix (``'.py'``, ``'.pem'``), an exact file name
+            (``'.env'``, ``'Pipfile'``) or ``REQUIREMENTS_BUCKET`` to
+            ``(path, rel_path)`` pairs
+        """
+        if self._buckets is not None:
+            return self._buckets
+
+        buckets = {key: [] for key in chain(WANTED_SUFFIXES, WANTED_NAMES, (REQUIREMENTS_BUCKET,))}
+        root = str(self.project_root)
+        prefix_len = len(os.path.join(root, ''))
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d.lower() not in EXCLUDED_DIRS]
+            rel_dir = dirpath[prefix_len:]
+            for name in filenames:
+                suffix = os.path.splitext(name)[1]
+                in_suffix = suffix in WANTED_SUFFIXES
+                in_name = name in WANTED_NAMES
+                is_requirements = name.startswith('requirements') and suffix == '.txt'
+                if not (in_suffix or in_name or is_requirements):
+                    continue
+
+                entry = (os.path.join(dirpath, name), os.path.join(rel_dir, name))
+                if in_suffix:
+                    buckets[suffix].append(entry)
+                if in_name:
+                    buckets[name].append(entry)
+                if is_requirements:
+                    buckets[REQUIREMENTS_BUCKET].append(entry)
+
+        self._buckets = buckets
+        return buckets
+
+    def _collect_files(self) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Walk the project once and cache scannable files by suffix.
+
+        Returns:
+            Dict mapping suffix to ``(path, rel_path)`` pairs
+        """
+        if self._files is not None:
+            return self._files
+
+        buckets = self._enumerate_once()
+        self._files = {suffix: [] for suffix in SCANS_BY_SUFFIX}
+        for file_path, rel_path in chain.from_iterable(buckets[suffix] for suffix in SCANS_BY_SUFFIX):
+            name = os.path.basename(file_path)
+            if name in NOISE_FILENAMES or name.endswith(NOISE_SUFFIXES):
+                continue
+            try:
+                size = os.path.getsize(file_path)
+            except OSError:
+                size = 0
+            if size > MAX_SCAN_BYTES:
+                self.log('INFO', f"Skipped file larger than {MAX_SCAN_BYTES // 1024} KB "
+                                 f"({size} bytes)", rel_path)
+                continue
+            self._files[os.path.splitext(file_path)[1]].append((file_path, rel_path))
+            self.bytes_scanned += size
+
+        return self._files
+
+    def _scan_all_files(self) -> Dict[str, List[Tuple[str, str, str]]]:
+        """
+        Walk the project once, read each file once, and run every content check on it.
+
+        Findings are bucketed per check so the public ``check_*`` methods can
+        still report their own results. The scan only runs on the first call.
+        Large trees are fanned out over ``self.cores`` worker processes.
+        """
+        if self._findings is not None:
+            return self._findings
+
+        jobs = [
+            (file_path, rel_path, SCANS_BY_SUFFIX[suffix])
+            for suffix, files in self._collect_files().items()
+            for file_path, rel_path in files
+        ]
+
+        if self.cores > 1 and len(jobs) >= PARALLEL_MIN_FILES:
+            with ProcessPoolExecutor(max_workers=self.cores, initializer=_init_worker,
+                                     initargs=(PATTERN_SPECS, self.engine)) as executor:
+                results = list(executor.map(_scan_one_file, jobs, chunksize=32))
+        else:
+            results = [(rel_path, self._scanner.scan_file(file_path, checks))
+                       for file_path, rel_path, checks in jobs]
+
+        self._findings = {check: [] for check in CHECK_NAMES}
+        for rel_path, findings in results:
+            for check, level, message in findings:
+                self._findings[check].append((level, message, rel_path))
+
+        return self._findings
+
+    def _report_findings(self, check: str) -> None:
+        """Log the findings collected for one check by the shared file scan."""
+        for level, message, file_path in self._scan_all_files()[check]:
+            self.log(level, message, file_path)
+
     def check_hardcoded_secrets(self) -> None:
         """Check for hardcoded API keys, passwords, and secrets."""
         print("🔍 Checking for hardcoded secrets...")
-        
-        # Patterns that indicate potential secrets
-        secret_patterns = [
-            (r'api[_-]?key\s*[=:]\s*["\'][^"\']{20,}["\']', 'API key'),
-            (r'password\s*[=:]\s*["\'][^"\']+["\']', 'Password'),
-            (r'secret\s*[=:]\s*["\'][^"\']{10,}["\']', 'Secret'),
-            (r'token\s*[=:]\s*["\'][^"\']{20,}["\']', 'Token'),
-            (r'sk-[A-Za-z0-9]{20,}', 'OpenAI API key'),
-            (r'xoxb-[0-9]{10,}-[0-9]{10,}-[A-Za-z0-9]{20,}', 'Slack token'),
-            (r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', 'UUID/GUID'),
-        ]
-        
-        python_files = self.project_root.rglob("*.py")
-        yaml_files = self.project_root.rglob("*.yaml")
-        json_files = self.project_root.rglob("*.json")
-        
-        for file_path in list(python_files) + list(yaml_files) + list(json_files):
-            # Skip test files and examples
-            if 'test' in str(file_path).lower() or 'example' in str(file_path).lower():
-                continue
-                
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                
-                for pattern, secret_type in secret_patterns:
-                    matches = re.finditer(pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        # Skip obvious placeholders
-                        matched_text = match.group()
-                        if any(placeholder in matched_text.lower() for placeholder in [
-                            'your_', 'placeholder', 'example', 'dummy', 'test',
-                            'fake', 'sample', 'template', 'xxx', '***'
-                        ]):
-                            continue
-                            
-                        self.log('ERROR', f"Potential {secret_type} found: {matched_text[:50]}...", 
-                                str(file_path.relative_to(self.project_root)))
-                                
-            except Exception as e:
-                self.log('WARNING', f"Could not scan file: {e}", str(file_path.relative_to(self.project_root)))
+        self._report_findings('secrets')
     
     def check_network_security(self) -> None:
         """Check network security practices."""
         print("🌐 Checking network security...")
-        
-        python_files = self.project_root.rglob("*.py")
-        
-        for file_path in python_files:
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                
-                # Check for HTTP URLs (should be HTTPS)
-                http_pattern = r'http://[^\s"\']*'
-                http_matches = re.finditer(http_pattern, content)
-                for match in http_matches:
-                    url = match.group()
-                    if 'localhost' not in url and '127.0.0.1' not in url:
-                        self.log('WARNING', f"HTTP URL found (should use HTTPS): {url}",
-                                str(file_path.relative_to(self.project_root)))
-                
-                # Check for disabled SSL verification
-                ssl_disable_patterns = [
-                    r'verify\s*=\s*False',
-                    r'ssl_verify\s*=\s*False',
-                    r'CERT_NONE',
-                ]
-                
-                for pattern in ssl_disable_patterns:
-                    matches = re.finditer(pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        self.log('ERROR', f"SSL verification disabled: {match.group()}",
-                                str(file_path.relative_to(self.project_root)))
-                
-            except Exception as e:
-                self.log('WARNING', f"Could not scan file: {e}", str(file_path.relative_to(self.project_root)))
+        self._report_findings('network')
     
     def check_input_validation(self) -> None:
         """Check for input validation practices."""
         print("🛡️ Checking input validation...")
-        
-        python_files = self.project_root.rglob("*.py")
-        
-        for file_path in python_files:
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                
-                # Check for dangerous functions
-                dangerous_functions = ['eval', 'exec', 'compile', '__import__']
-                
-                for func in dangerous_functions:
-                    pattern = rf'\b{func}\s*\('
-                    matches = re.finditer(pattern, content)
-                    for match in matches:
-                        self.log('ERROR', f"Dangerous function used: {func}()",
-                                str(file_path.relative_to(self.project_root)))
-                
-                # Check for SQL injection patterns
-                sql_patterns = [
-                    r'\.format\s*\([^)]*\+[^)]*\)',
-                    r'%\s*\([^)]*\+[^)]*\)',
-                    r'"[^"]*\+[^"]*"',
-                ]
-                
-                for pattern in sql_patterns:
-                    matches = re.finditer(pattern, content)
-                    for match in matches:
-                        if 'sql' in content.lower() or 'query' in content.lower():
-                            self.log('WARNING', f"Potential SQL injection risk: {match.group()}",
-                                    str(file_path.relative_to(self.project_root)))
-                
-            except Exception as e:
-                self.log('WARNING', f"Could not scan file: {e}", str(file_path.relative_to(self.project_root)))
+        self._report_findings('input_validation')
     
     def check_logging_security(self) -> None:
         """Check logging practices for security."""
         print("📝 Checking logging security...")
-        
-        python_files = self.project_root.rglob("*.py")
-        
-        for file_path in python_files:
-            try:
-                content = file_path.read_text(encoding='utf-8')
-                
-                # Check for logging of sensitive data
-                sensitive_log_patterns = [
-                    r'log[^(]*\([^)]*password[^)]*\)',
-                    r'log[^(]*\([^)]*api_key[^)]*\)',
-                    r'log[^(]*\([^)]*secret[^)]*\)',
-                    r'log[^(]*\([^)]*token[^)]*\)',
-                    r'print\([^)]*password[^)]*\)',
-                    r'print\([^)]*api_key[^)]*\)',
-                ]
-                
-                for pattern in sensitive_log_patterns:
-                    matches = re.finditer(pattern, content, re.IGNORECASE)
-                    for match in matches:
-                        self.log('WARNING', f"Potential sensitive data logging: {match.group()[:100]}",
-                                str(file_path.relative_to(self.project_root)))
-                
-            except Exception as e:
-                self.log('WARNING', f"Could not scan file: {e}", str(file_path.relative_to(self.project_root)))
+        self._report_findings('logging')
     
     def check_environment_config(self) -> None:
         """Check environment configuration security."""
@@ -226,9 +682,8 @@ class SecurityChecker:
                 self.log('WARNING', f"Environment configuration warning: {warning}")
             
             # Check for .env files that shouldn't be committed
-            env_files = list(self.project_root.rglob(".env"))
-            for env_file in env_files:
-                if env_file.name != '.env.template':
+            for env_file, _ in self._enumerate_once()['.env']:
+                if os.path.basename(env_file) != '.env.template':
                     self.log('ERROR', f".env file found - should not be in version control: {env_file}")
             
         except Exception as e:
@@ -238,45 +693,31 @@ class SecurityChecker:
         """Check file permissions and ownership."""
         print("🔐 Checking file permissions...")
         
-        sensitive_files = [
-            ".env",
-            "settings.yaml",
-            "*.key",
-            "*.pem",
-            "*.p12",
-            "*.pfx",
-        ]
-        
-        for pattern in sensitive_files:
-            files = self.project_root.rglob(pattern)
-            for file_path in files:
-                try:
-                    stat = file_path.stat()
-                    mode = oct(stat.st_mode)[-3:]
-                    
-                    # Check if file is readable by others
-                    if mode[2] in ['4', '5', '6', '7']:
-                        self.log('WARNING', f"Sensitive file readable by others: {file_path} ({mode})")
-                    
-                    # Check if file is writable by others
-                    if mode[2] in ['2', '3', '6', '7']:
-                        self.log('ERROR', f"Sensitive file writable by others: {file_path} ({mode})")
-                        
-                except Exception as e:
-                    self.log('WARNING', f"Could not check permissions for {file_path}: {e}")
+        buckets = self._enumerate_once()
+        sensitive = chain.from_iterable(buckets[key] for key in chain(SENSITIVE_NAMES, SENSITIVE_SUFFIXES))
+        for file_path, _ in sensitive:
+            try:
+                mode = os.stat(file_path).st_mode
+                other = mode & 0o007
+
+                # Check if file is readable by others
+                if other & 0o004:
+                    self.log('WARNING', f"Sensitive file readable by others: {file_path} ({mode & 0o777:03o})")
+
+                # Check if file is writable by others
+                if other & 0o002:
+                    self.log('ERROR', f"Sensitive file writable by others: {file_path} ({mode & 0o777:03o})")
+
+            except Exception as e:
+                self.log('WARNING', f"Could not check permissions for {file_path}: {e}")
     
     def check_dependencies(self) -> None:
         """Check for known security vulnerabilities in dependencies."""
         print("📦 Checking dependencies...")
         
         # Look for requirements files
-        req_files = list(self.project_root.rglob("requirements*.txt"))
-        req_files.extend(self.project_root.rglob("Pipfile"))
-        req_files.extend(self.project_root.rglob("pyproject.toml"))
-        
-        if not req_files:
-            self.log('WARNING', "No dependency files found")
-            return
+        buckets = self._enumerate_once()
+        req_files = chain.from_iterable(buckets[key] for key in (REQUIREMENTS_BUCKET,) + DEPENDENCY_NAMES)
         
         # Basic check for outdated or risky packages
         risky_packages = [
@@ -285,16 +726,21 @@ class SecurityChecker:
             'subprocess',  # Command injection risk if misused
         ]
         
-        for req_file in req_files:
+        found = False
+        for req_file, rel_path in req_files:
+            found = True
             try:
-                content = req_file.read_text()
+                with open(req_file) as f:
+                    content = f.read()
                 for package in risky_packages:
                     if package in content:
-                        self.log('WARNING', f"Potentially risky package: {package}",
-                                str(req_file.relative_to(self.project_root)))
+                        self.log('WARNING', f"Potentially risky package: {package}", rel_path)
                         
             except Exception as e:
                 self.log('WARNING', f"Could not scan dependency file {req_file}: {e}")
+
+        if not found:
+            self.log('WARNING', "No dependency files found")
     
     def generate_report(self) -> Dict[str, Any]:
         """Generate a comprehensive security report."""
@@ -312,12 +758,13 @@ class SecurityChecker:
             status = "❌ SECURITY RISKS"
         
         report = {
-            'timestamp': '2024-09-09T12:00:00Z',  # In real implementation, use datetime.utcnow()
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z'),
             'status': status,
             'summary': {
                 'total_issues': total_issues,
                 'total_warnings': total_warnings,
-                'total_info': len(self.info)
+                'total_info': len(self.info),
+                'bytes_scanned': self.bytes_scanned
             },
             'issues': self.issues,
             'warnings': self.warnings,
@@ -331,19 +778,19 @@ class SecurityChecker:
         """Get security recommendations based on findings."""
         recommendations = []
         
-        if any('password' in issue['message'].lower() for issue in self.issues):
+        if self._flags['password']:
             recommendations.append("Remove all hardcoded passwords and use environment variables")
         
-        if any('api_key' in issue['message'].lower() for issue in self.issues):
+        if self._flags['api_key']:
             recommendations.append("Move API keys to environment variables or .env file")
         
-        if any('http://' in issue['message'] for issue in self.warnings):
+        if self._flags['http']:
             recommendations.append("Replace HTTP URLs with HTTPS for production")
         
-        if any('ssl' in issue['message'].lower() for issue in self.issues):
+        if self._flags['ssl']:
             recommendations.append("Enable SSL certificate verification")
         
-        if any('logging' in issue['message'].lower() for issue in self.warnings):
+        if self._flags['logging']:
             recommendations.append("Review logging practices to avoid sensitive data exposure")
         
         if len(self.warnings) > 5:
@@ -367,6 +814,10 @@ def main():
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--output', '-o', help='Output report to file (JSON)')
     parser.add_argument('--project-root', default='..', help='Project root directory')
+    parser.add_argument('--cores', type=int, default=os.cpu_count(),
+                        help='Worker processes for file scanning (default: CPU count)')
+    parser.add_argument('--engine', choices=ENGINES,
+                        help='Regex engine: re, re2 or hyperscan (default: best installed)')
     
     args = parser.parse_args()
     
@@ -381,7 +832,9 @@ def main():
     print(f"=" * 60)
     
     # Run security checks
-    checker = SecurityChecker(str(project_root), args.verbose)
+    checker = SecurityChecker(str(project_root), args.verbose, cores=args.cores, engine=args.engine)
+    if args.engine and checker.engine != args.engine:
+        print(f"⚠️ {args.engine} is not installed, scanning with {checker.engine}")
     
     checker.check_hardcoded_secrets()
     checker.check_network_security()
@@ -401,6 +854,7 @@ def main():
     print(f"Issues: {report['summary']['total_issues']}")
     print(f"Warnings: {report['summary']['total_warnings']}")
     print(f"Info: {report['summary']['total_info']}")
+    print(f"Scanned: {report['summary']['bytes_scanned'] / 1024:.1f} KB")
     
     # Print issues and warnings
     if report['issues']:
@@ -426,8 +880,8 @@ def main():
     
     # Save report if requested
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(report, f, indent=2)
+        with open(args.output, 'wb') as f:
+            f.write(_dumps_report(report))
         print(f"\n📄 Report saved to: {args.output}")
     
     # Exit with appropriate code
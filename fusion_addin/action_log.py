@@ -13,20 +13,220 @@ import csv
 import os
 import hashlib
 import gzip
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+import math
+import mmap
+import shutil
+import sys
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Any, Union, Iterator, Tuple
+from itertools import islice
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Sidecar index of saved entries: one JSON row per line with entry_id, file, timestamp
+INDEX_FILENAME = "index.jsonl"
+INDEX_READ_BLOCK = 8192
+
+# Write buffer for CSV exports
+EXPORT_BUFFER_SIZE = 1024 * 1024
+
+# Export loads log files in a process pool from this many files upward
+PARALLEL_LOAD_MIN_FILES = 8
+
+# Compression level for finished session logs when zstandard is installed
+ZSTD_LEVEL = 9
+
+# Session logs are NDJSON, one entry per line; .json is the older
+# single-document format and still loads
+LOG_SUFFIXES = ('.ndjson', '.json')
+COMPRESSED_SUFFIXES = ('.gz', '.zst')
+ALL_LOG_SUFFIXES = LOG_SUFFIXES + tuple(suffix + extension for suffix in LOG_SUFFIXES
+                                        for extension in COMPRESSED_SUFFIXES)
+
+
+def _dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if pretty else None).encode()
+
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON bytes or text, with orjson when it is installed.
+    
+    Falls back to stdlib json for what orjson rejects, such as the NaN and
+    Infinity literals stdlib json writes.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _parse_log_data(buffer: Union[bytes, mmap.mmap], ndjson: bool, log_file: Path) -> List[Dict]:
+    """
+    Parse entry dictionaries from the raw contents of a log file.
+    
+    NDJSON logs are parsed line by line; a line left truncated by an
+    interrupted append is skipped instead of failing the whole file.
+    Legacy .json logs are one document: orjson reads a mapping
+    zero-copy, stdlib json needs it decoded to str first.
+    """
+    if not ndjson:
+        data = None
+        if ORJSON_AVAILABLE:
+            try:
+                with memoryview(buffer) as view:
+                    data = orjson.loads(view)
+            except orjson.JSONDecodeError:
+                pass
+        if data is None:
+            data = json.loads(str(buffer, 'utf-8'))
+        return data.get('entries', [])
+    
+    records = []
+    start, end = 0, len(buffer)
+    while start < end:
+        stop = buffer.find(b'\n', start)
+        if stop == -1:
+            stop = end
+        line = buffer[start:stop]
+        start = stop + 1
+        if not line.strip():
+            continue
+        try:
+            record = _loads(line)
+        except ValueError as e:
+            logger.warning(f"Skipping unreadable line in log file {log_file}: {e}")
+            continue
+        if 'session_info' not in record:
+            records.append(record)
+    return records
+
+
+def _read_log_records(log_file: Path) -> List[Dict]:
+    """Read the stored entry dictionaries of a plain or compressed log file."""
+    ndjson = '.ndjson' in log_file.suffixes
+    
+    # Handle compressed files
+    if log_file.suffix == '.gz':
+        with gzip.open(log_file, 'rb') as f:
+            return _parse_log_data(f.read(), ndjson, log_file)
+    if log_file.suffix == '.zst':
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard is not installed")
+        with open(log_file, 'rb') as raw:
+            with zstandard.ZstdDecompressor().stream_reader(raw) as reader:
+                return _parse_log_data(reader.read(), ndjson, log_file)
+    
+    # Parse straight from the mapped pages instead of through a
+    # full-file bytes buffer
+    with open(log_file, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _parse_log_data(mm, ndjson, log_file)
+
+
+def _load_log_records_worker(log_file: Path) -> Tuple[List[Dict], Optional[str]]:
+    """Process-pool entry point: (records, None), or ([], error) when the file cannot be read."""
+    try:
+        return _read_log_records(log_file), None
+    except Exception as e:
+        return [], str(e)
+
+
+def _can_spawn_workers() -> bool:
+    """Check that worker processes can be started from sys.executable."""
+    return os.path.basename(sys.executable or '').lower().startswith('python')
+
+
+def _canonical_payload(entry: Any) -> bytes:
+    """
+    Serialize the checksummed fields of an entry as sorted, compact JSON.
+    
+    Always uses stdlib json so checksums do not depend on whether orjson
+    is installed. NaN and Infinity are checksummed as null, which is how
+    orjson writes them, so a stored entry matches its checksum whichever
+    encoder wrote it.
+    """
+    payload = {
+        'plan_id': entry.plan_id,
+        'plan_data': entry.plan_data,
+        'execution_result': entry.execution_result,
+        'timeline_mapping': entry.timeline_mapping
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'),
+                           check_circular=False).encode()
+    if b'NaN' in canonical or b'Infinity' in canonical:
+        canonical = json.dumps(_finite(payload), sort_keys=True, separators=(',', ':'),
+                               check_circular=False).encode()
+    return canonical
+
+
+def _finite(value: Any) -> Any:
+    """Copy value with NaN and Infinity floats replaced by None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+# datetime.fromisoformat accepts a trailing 'Z' (UTC) from Python 3.11
+_ISOFORMAT_PARSES_Z = sys.version_info >= (3, 11)
+
+
+def _parse_timestamp(stamp: str) -> datetime:
+    """Parse a stored ISO timestamp; a trailing 'Z' gives an aware UTC datetime."""
+    if _ISOFORMAT_PARSES_Z or not stamp.endswith('Z'):
+        return datetime.fromisoformat(stamp)
+    return datetime.fromisoformat(stamp[:-1]).replace(tzinfo=timezone.utc)
+
+
+# Summary formatters by operation type: (params, extract_param_value) -> text
+_OP_FORMATTERS = {
+    'create_sketch': lambda p, ex: f"sketch({p.get('name', 'unnamed')})",
+    'draw_rectangle': lambda p, ex: f"rectangle({ex(p.get('width'))}x{ex(p.get('height'))})",
+    'draw_circle': lambda p, ex: f"circle(⌀{ex(p.get('diameter'))})",
+    'extrude': lambda p, ex: f"extrude({ex(p.get('distance'))})",
+    'create_hole': lambda p, ex: f"hole(⌀{ex(p.get('diameter'))})",
+    'fillet': lambda p, ex: f"fillet(R{ex(p.get('radius'))})",
+}
+
 
 class ActionLogEntry:
     """
     Represents a single action log entry with complete audit information.
     """
     
+    __slots__ = ('timestamp', 'entry_id', 'plan_id', 'plan_data', 'execution_result',
+                 'timeline_mapping', 'checksum', 'natural_language_prompt', 'operation_count',
+                 'execution_duration', 'success', 'error_message', '_summary', '_canonical')
+    
     def __init__(self, plan_id: str, plan_data: Dict, execution_result: Dict,
                  timeline_mapping: Optional[Dict] = None):
         """
@@ -38,13 +238,17 @@ class ActionLogEntry:
             execution_result: Results of plan execution
             timeline_mapping: Mapping of operations to Fusion timeline nodes
         """
-        self.entry_id = self._generate_entry_id()
         self.timestamp = datetime.utcnow()
+        self.entry_id = self._generate_entry_id(self.timestamp)
         self.plan_id = plan_id
         self.plan_data = plan_data
         self.execution_result = execution_result
         self.timeline_mapping = timeline_mapping or {}
-        self.checksum = self._calculate_checksum()
+        
+        # The checksummed bytes are kept until the entry is saved, which
+        # splices them into the log line instead of serializing plan_data again
+        self._canonical = _canonical_payload(self)
+        self.checksum = hashlib.blake2b(self._canonical, digest_size=8).hexdigest()
         
         # Extract key metadata
         self.natural_language_prompt = plan_data.get('metadata', {}).get(
@@ -54,23 +258,39 @@ class ActionLogEntry:
         self.execution_duration = execution_result.get('duration_seconds', 0)
         self.success = execution_result.get('success', False)
         self.error_message = execution_result.get('error_message')
+        self._summary = None
     
-    def _generate_entry_id(self) -> str:
-        """Generate unique entry ID."""
-        timestamp_str = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
-        random_suffix = hashlib.md5(str(datetime.utcnow()).encode()).hexdigest()[:8]
+    def _generate_entry_id(self, timestamp: datetime) -> str:
+        """Generate unique entry ID from the entry timestamp and a random suffix."""
+        timestamp_str = timestamp.strftime('%Y%m%d_%H%M%S')
+        random_suffix = os.urandom(4).hex()
         return f"entry_{timestamp_str}_{random_suffix}"
     
     def _calculate_checksum(self) -> str:
-        """Calculate CRC checksum for data integrity."""
-        data_str = json.dumps({
-            'plan_id': self.plan_id,
-            'plan_data': self.plan_data,
-            'execution_result': self.execution_result,
-            'timeline_mapping': self.timeline_mapping
-        }, sort_keys=True)
+        """Calculate a 64-bit BLAKE2b checksum for data integrity."""
+        return hashlib.blake2b(_canonical_payload(self), digest_size=8).hexdigest()
+    
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize the entry as one JSON object, equivalent to to_dict().
+        
+        Reuses the checksummed payload bytes when they are still held.
+        """
+        canonical = self._canonical
+        if canonical is None:
+            return _dumps(self.to_dict())
         
-        return hashlib.sha256(data_str.encode()).hexdigest()[:16]
+        header = _dumps({
+            'entry_id': self.entry_id,
+            'timestamp': self.timestamp.isoformat() + 'Z',
+            'natural_language_prompt': self.natural_language_prompt,
+            'operation_count': self.operation_count,
+            'execution_duration': self.execution_duration,
+            'success': self.success,
+            'error_message': self.error_message,
+            'checksum': self.checksum
+        })
+        return header[:-1] + b',' + canonical[1:]
     
     def to_dict(self) -> Dict:
         """Convert entry to dictionary for serialization."""
@@ -90,7 +310,13 @@ class ActionLogEntry:
         }
     
     def get_human_readable_summary(self) -> str:
-        """Generate human-readable summary of the action."""
+        """Generate human-readable summary of the action (built once, then cached)."""
+        if self._summary is None:
+            self._summary = self._build_summary()
+        return self._summary
+    
+    def _build_summary(self) -> str:
+        """Build the summary string from the first operations of the plan."""
         operations = self.plan_data.get('operations', [])
         
         if not operations:
@@ -100,26 +326,9 @@ class ActionLogEntry:
         op_summary = []
         for op in operations[:5]:  # Show first 5 operations
             op_type = op.get('op', 'unknown')
-            params = op.get('params', {})
-            
-            if op_type == 'create_sketch':
-                op_summary.append(f"sketch({params.get('name', 'unnamed')})")
-            elif op_type == 'draw_rectangle':
-                width = self._extract_param_value(params.get('width'))
-                height = self._extract_param_value(params.get('height'))
-                op_summary.append(f"rectangle({width}x{height})")
-            elif op_type == 'draw_circle':
-                diameter = self._extract_param_value(params.get('diameter'))
-                op_summary.append(f"circle(⌀{diameter})")
-            elif op_type == 'extrude':
-                distance = self._extract_param_value(params.get('distance'))
-                op_summary.append(f"extrude({distance})")
-            elif op_type == 'create_hole':
-                diameter = self._extract_param_value(params.get('diameter'))
-                op_summary.append(f"hole(⌀{diameter})")
-            elif op_type == 'fillet':
-                radius = self._extract_param_value(params.get('radius'))
-                op_summary.append(f"fillet(R{radius})")
+            formatter = _OP_FORMATTERS.get(op_type)
+            if formatter:
+                op_summary.append(formatter(op.get('params', {}), self._extract_param_value))
             else:
                 op_summary.append(op_type)
         
@@ -141,6 +350,79 @@ class ActionLogEntry:
         return str(param) if param is not None else "?"
 
 
+class _LazyEntryView:
+    """
+    Read-only view over a stored log entry dictionary.
+    
+    Entries loaded from disk are wrapped rather than rebuilt through
+    ActionLogEntry.__init__, so no checksum is recomputed and derived
+    fields are only computed when read. Exposes the same attributes.
+    """
+    
+    __slots__ = ('_d', '_ts', '_summary')
+    
+    def __init__(self, entry_data: Dict):
+        self._d = entry_data
+        self._ts = None
+        self._summary = None
+    
+    @property
+    def entry_id(self) -> str:
+        return self._d['entry_id']
+    
+    @property
+    def timestamp(self) -> datetime:
+        if self._ts is None:
+            self._ts = _parse_timestamp(self._d['timestamp'])
+        return self._ts
+    
+    @property
+    def plan_id(self) -> str:
+        return self._d['plan_id']
+    
+    @property
+    def plan_data(self) -> Dict:
+        return self._d['plan_data']
+    
+    @property
+    def execution_result(self) -> Dict:
+        return self._d['execution_result']
+    
+    @property
+    def timeline_mapping(self) -> Dict:
+        return self._d.get('timeline_mapping') or {}
+    
+    @property
+    def checksum(self) -> str:
+        checksum = self._d.get('checksum')
+        return checksum if checksum is not None else ActionLogEntry._calculate_checksum(self)
+    
+    @property
+    def natural_language_prompt(self) -> str:
+        return self.plan_data.get('metadata', {}).get('natural_language_prompt', 'Unknown prompt')
+    
+    @property
+    def operation_count(self) -> int:
+        return len(self.plan_data.get('operations', []))
+    
+    @property
+    def execution_duration(self) -> float:
+        return self.execution_result.get('duration_seconds', 0)
+    
+    @property
+    def success(self) -> bool:
+        return self.execution_result.get('success', False)
+    
+    @property
+    def error_message(self) -> Optional[str]:
+        return self.execution_result.get('error_message')
+    
+    to_dict = ActionLogEntry.to_dict
+    get_human_readable_summary = ActionLogEntry.get_human_readable_summary
+    _build_summary = ActionLogEntry._build_summary
+    _extract_param_value = ActionLogEntry._extract_param_value
+
+
 class ActionLogger:
     """
     Comprehensive action logging system with persistence and export capabilities.
@@ -160,11 +442,20 @@ class ActionLogger:
         
         self.session_entries: List[ActionLogEntry] = []
         self.current_session_file = self._get_session_filename()
+        self.index_path = self.log_directory / INDEX_FILENAME
+        self._saved_count = 0
+        self._spilled_count = 0
+        self._log_files_cache: Optional[List[Path]] = None
+        self._cache_mtime: Optional[int] = None
         
         # Configuration
         self.auto_save = self.settings.get('auto_save_logs', True)
         self.max_log_age_days = self.settings.get('max_log_age_days', 90)
         self.compress_old_logs = self.settings.get('compress_old_logs', True)
+        self.compress_after_days = self.settings.get('compress_after_days', 7)
+        self.pretty_json = self.settings.get('pretty_json_logs', False)
+        self.parallel_loading = self.settings.get('parallel_log_loading', True)
+        self.in_memory_cap = max(1, self.settings.get('max_session_entries_in_memory', 256))
         
         logger.info(f"Action logger initialized with directory: {self.log_directory}")
     
@@ -190,31 +481,46 @@ class ActionLogger:
         if self.auto_save:
             self._save_session_log()
         
+        if len(self.session_entries) > self.in_memory_cap:
+            self._spill_session_entries()
+        
         return entry.entry_id
     
     def get_session_log(self) -> List[ActionLogEntry]:
-        """Get all entries from current session."""
-        return self.session_entries.copy()
+        """Get all entries from current session, including ones spilled to disk."""
+        return self._load_spilled_entries() + self.session_entries
     
     def get_recent_entries(self, count: int = 10) -> List[ActionLogEntry]:
         """Get most recent entries across all logs."""
         all_entries = []
         
-        # Add current session entries
+        # Add current session entries; spilled ones are older than all
+        # in-memory ones, so they only matter when those cannot cover count
         all_entries.extend(self.session_entries)
+        if count > len(self.session_entries):
+            all_entries.extend(self._load_spilled_entries())
         
-        # Load recent log files
-        log_files = sorted(self.log_directory.glob("action_log_*.json"), reverse=True)
+        # The index tail names the files holding the newest saved entries;
+        # fall back to the newest log files when it cannot cover count
+        rows = self._read_index(tail=count)
+        if count > 0 and len(rows) >= count:
+            file_names = {row['file'] for row in rows}
+            if self.session_entries:
+                file_names.discard(self.current_session_file)
+            log_files = [self.log_directory / name for name in sorted(file_names, reverse=True)]
+        else:
+            log_files = self._list_log_files()[::-1][:5]
         
-        for log_file in log_files[:5]:  # Check last 5 log files
+        for log_file in log_files:  # Check last 5 log files, or the indexed ones
             try:
                 entries = self._load_log_file(log_file)
                 all_entries.extend(entries)
             except Exception as e:
                 logger.warning(f"Failed to load log file {log_file}: {e}")
         
-        # Sort by timestamp and return most recent
-        all_entries.sort(key=lambda x: x.timestamp, reverse=True)
+        # Sort by timestamp and return most recent; session entries are
+        # naive UTC, loaded (including spilled) ones are timezone-aware
+        all_entries.sort(key=lambda x: self._naive_utc(x.timestamp), reverse=True)
         return all_entries[:count]
     
     def export_action_log(self, format: str = 'json', filename: Optional[str] = None,
@@ -254,6 +560,8 @@ class ActionLogger:
             self._export_txt(entries_to_export, export_path)
         else:
             raise ValueError(f"Unsupported export format: {format}")
+
+        self._log_files_cache = None
         
         logger.info(f"Exported {len(entries_to_export)} entries to {export_path}")
         return str(export_path)
@@ -273,8 +581,18 @@ class ActionLogger:
             if entry.entry_id == entry_id:
                 return self._prepare_replay_data(entry)
         
+        # Look up the file holding the entry in the index
+        for row in reversed(self._read_index()):
+            if row.get('entry_id') == entry_id:
+                log_file = self.log_directory / row['file']
+                if log_file.exists():
+                    for entry in self._load_log_file(log_file):
+                        if entry.entry_id == entry_id:
+                            return self._prepare_replay_data(entry)
+                break
+        
         # Search in historical logs
-        log_files = sorted(self.log_directory.glob("action_log_*.json"), reverse=True)
+        log_files = self._list_log_files()[::-1]
         
         for log_file in log_files:
             try:
@@ -289,9 +607,38 @@ class ActionLogger:
     
     def get_statistics(self) -> Dict:
         """Get usage statistics from action logs."""
-        all_entries = self.get_recent_entries(1000)  # Last 1000 entries
+        total_actions = successful_actions = 0
+        duration_sum = 0.0
+        duration_count = 0
+        operation_counts = Counter()
+        recent_activity = 0
+        oldest = newest = None
+        week_ago = datetime.utcnow() - timedelta(days=7)
+        
+        # One pass over the last 1000 entries, newest first, without collecting them
+        for entry in islice(self._iter_entries_newest_first(), 1000):
+            total_actions += 1
+            if entry.success:
+                successful_actions += 1
+            
+            duration = entry.execution_duration
+            if duration > 0:
+                duration_sum += duration
+                duration_count += 1
+            
+            for op in entry.plan_data.get('operations', []):
+                operation_counts[op.get('op', 'unknown')] += 1
+            
+            # Session entries are naive UTC, loaded ones are timezone-aware
+            timestamp = self._naive_utc(entry.timestamp)
+            if timestamp >= week_ago:
+                recent_activity += 1
+            if oldest is None or timestamp < oldest[0]:
+                oldest = (timestamp, entry.timestamp)
+            if newest is None or timestamp > newest[0]:
+                newest = (timestamp, entry.timestamp)
         
-        if not all_entries:
+        if not total_actions:
             return {
                 'total_actions': 0,
                 'success_rate': 0.0,
@@ -300,44 +647,40 @@ class ActionLogger:
                 'recent_activity': []
             }
         
-        # Calculate statistics
-        total_actions = len(all_entries)
-        successful_actions = sum(1 for entry in all_entries if entry.success)
-        success_rate = successful_actions / total_actions if total_actions > 0 else 0
-        
-        durations = [entry.execution_duration for entry in all_entries if entry.execution_duration > 0]
-        avg_duration = sum(durations) / len(durations) if durations else 0
-        
-        # Count operation types
-        operation_counts = {}
-        for entry in all_entries:
-            for op in entry.plan_data.get('operations', []):
-                op_type = op.get('op', 'unknown')
-                operation_counts[op_type] = operation_counts.get(op_type, 0) + 1
-        
-        most_common_ops = sorted(operation_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        
-        # Recent activity (last 7 days)
-        week_ago = datetime.utcnow() - timedelta(days=7)
-        recent_entries = [e for e in all_entries if e.timestamp >= week_ago]
+        success_rate = successful_actions / total_actions
+        avg_duration = duration_sum / duration_count if duration_count else 0
         
         return {
             'total_actions': total_actions,
             'success_rate': round(success_rate * 100, 1),
             'avg_duration': round(avg_duration, 2),
-            'most_common_operations': most_common_ops,
-            'recent_activity': len(recent_entries),
-            'oldest_entry': min(all_entries, key=lambda x: x.timestamp).timestamp.isoformat() if all_entries else None,
-            'newest_entry': max(all_entries, key=lambda x: x.timestamp).timestamp.isoformat() if all_entries else None
+            'most_common_operations': operation_counts.most_common(10),
+            'recent_activity': recent_activity,
+            'oldest_entry': oldest[1].isoformat(),
+            'newest_entry': newest[1].isoformat()
         }
     
+    def _iter_entries_newest_first(self) -> Iterator[ActionLogEntry]:
+        """Yield session entries, then saved entries file by file, newest first."""
+        yield from reversed(self.session_entries)
+        if self._spilled_count:
+            yield from reversed(self._load_spilled_entries())
+        
+        # Session file names sort by start time; exports only repeat logged
+        # entries and this session's saved file repeats session_entries
+        # plus the spilled entries yielded above
+        skip = {self.current_session_file} if self.session_entries else set()
+        for log_file in reversed(self._list_log_files()):
+            if log_file.name in skip:
+                continue
+            yield from reversed(self._load_log_file(log_file))
+    
     def cleanup_old_logs(self) -> int:
         """Clean up old log files based on retention policy."""
         cutoff_date = datetime.utcnow() - timedelta(days=self.max_log_age_days)
         deleted_count = 0
         
-        log_files = list(self.log_directory.glob("action_log_*.json"))
-        log_files.extend(self.log_directory.glob("action_log_*.json.gz"))
+        log_files = self._list_log_files(exports=True)
         
         for log_file in log_files:
             try:
@@ -348,87 +691,310 @@ class ActionLogger:
                 
                 if file_date < cutoff_date:
                     log_file.unlink()
+                    self._log_files_cache = None
                     deleted_count += 1
                     logger.info(f"Deleted old log file: {log_file}")
                     
             except (ValueError, IndexError) as e:
                 logger.warning(f"Could not parse date from log file {log_file}: {e}")
         
+        renamed = self._compress_finished_logs() if self.compress_old_logs else {}
+        
+        if deleted_count or renamed:
+            self._prune_index(renamed)
+        
         return deleted_count
     
+    def _compress_finished_logs(self) -> Dict[str, str]:
+        """
+        Compress session logs not modified for compress_after_days.
+        
+        Returns:
+            Mapping of old file names to compressed file names
+        """
+        cutoff = time.time() - self.compress_after_days * 86400
+        renamed = {}
+        
+        for log_file in self._list_log_files(compressed=False):
+            if log_file.name == self.current_session_file:
+                continue
+            try:
+                if log_file.stat().st_mtime < cutoff:
+                    renamed[log_file.name] = self._compress_log_file(log_file).name
+            except OSError as e:
+                logger.warning(f"Failed to compress log file {log_file}: {e}")
+        
+        return renamed
+    
+    def _compress_log_file(self, log_file: Path) -> Path:
+        """Compress a log file with zstd (gzip without zstandard) and remove the original."""
+        if ZSTD_AVAILABLE:
+            target = log_file.with_name(log_file.name + '.zst')
+            with open(log_file, 'rb') as src, open(target, 'wb') as dst:
+                zstandard.ZstdCompressor(level=ZSTD_LEVEL).copy_stream(src, dst)
+        else:
+            target = log_file.with_name(log_file.name + '.gz')
+            with open(log_file, 'rb') as src, gzip.open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+        
+        log_file.unlink()
+        self._log_files_cache = None
+        logger.info(f"Compressed log file: {log_file} -> {target.name}")
+        return target
+    
+    def _list_log_files(self, compressed: bool = True, exports: bool = False) -> List[Path]:
+        """
+        List log files sorted by name (oldest session first).
+        
+        The listing is cached and only re-read, with os.scandir, when the log
+        directory's modification time changes or this logger adds or removes
+        a file itself.
+        
+        Args:
+            compressed: Include .gz and .zst files
+            exports: Include action_log_export_* files, which only repeat
+                logged entries
+            
+        Returns:
+            New list of log file paths
+        """
+        try:
+            mtime = self.log_directory.stat().st_mtime_ns
+        except OSError:
+            return []
+        
+        if self._log_files_cache is None or mtime != self._cache_mtime:
+            with os.scandir(self.log_directory) as it:
+                names = sorted(entry.name for entry in it
+                               if entry.name.startswith("action_log_")
+                               and entry.name.endswith(ALL_LOG_SUFFIXES)
+                               and entry.is_file())
+            self._log_files_cache = [self.log_directory / name for name in names]
+            self._cache_mtime = mtime
+        
+        return [log_file for log_file in self._log_files_cache
+                if (compressed or log_file.name.endswith(LOG_SUFFIXES))
+                and (exports or not log_file.name.startswith("action_log_export_"))]
+    
     def _get_session_filename(self) -> str:
         """Generate filename for current session."""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        return f"action_log_{timestamp}.json"
+        return f"action_log_{timestamp}.ndjson"
+    
+    def _spill_session_entries(self) -> None:
+        """
+        Drop the oldest session entries beyond in_memory_cap from memory.
+        
+        They are saved to the session file first, even with auto_save off,
+        and read back from it when needed; entries that could not be saved
+        stay in memory.
+        """
+        self._save_session_log()
+        
+        excess = min(len(self.session_entries) - self.in_memory_cap, self._saved_count)
+        if excess > 0:
+            del self.session_entries[:excess]
+            self._saved_count -= excess
+            self._spilled_count += excess
+    
+    def _load_spilled_entries(self) -> List[_LazyEntryView]:
+        """Load this session's entries that were spilled out of memory, oldest first."""
+        if not self._spilled_count:
+            return []
+        return self._load_log_file(self.log_directory / self.current_session_file)[:self._spilled_count]
     
     def _save_session_log(self) -> None:
-        """Save current session entries to file."""
-        if not self.session_entries:
+        """Append session entries not yet saved to the session's NDJSON file."""
+        new_entries = self.session_entries[self._saved_count:]
+        if not new_entries:
             return
         
         session_file = self.log_directory / self.current_session_file
         
         try:
-            # Convert entries to dictionaries
-            entries_data = [entry.to_dict() for entry in self.session_entries]
-            
-            # Save to file
-            with open(session_file, 'w') as f:
-                json.dump({
-                    'session_info': {
+            with open(session_file, 'ab') as f:
+                if f.tell() == 0:
+                    self._log_files_cache = None
+                    f.write(_dumps({'session_info': {
                         'created_at': datetime.utcnow().isoformat() + 'Z',
-                        'entry_count': len(entries_data),
-                        'version': '1.0'
-                    },
-                    'entries': entries_data
-                }, f, indent=2)
+                        'version': '2.0'
+                    }}) + b'\n')
+                for entry in new_entries:
+                    f.write(entry.to_json_bytes() + b'\n')
+                    entry._canonical = None
                 
-            logger.debug(f"Saved session log with {len(entries_data)} entries")
+            logger.debug(f"Appended {len(new_entries)} entries to session log")
+            
+            self._append_index(new_entries)
+            self._saved_count = len(self.session_entries)
             
         except Exception as e:
             logger.error(f"Failed to save session log: {e}")
     
-    def _load_log_file(self, log_file: Path) -> List[ActionLogEntry]:
-        """Load entries from a log file."""
-        entries = []
+    def _write_entries_json(self, path: Path, info_key: str, info: Dict,
+                            entries: List[ActionLogEntry]) -> None:
+        """
+        Write {info_key: info, "entries": [...]} serializing one entry at a time.
+        
+        Only a single entry's dictionary is alive at once, instead of the
+        whole list plus its serialized form. Output is compact unless the
+        pretty_json_logs setting is enabled. Used for JSON exports.
+        """
+        pretty = self.pretty_json
+        separator = b',\n' if pretty else b', '
+        
+        with open(path, 'wb') as f:
+            f.write(b'{"%s": ' % info_key.encode())
+            f.write(_dumps(info, pretty))
+            f.write(b', "entries": [')
+            for i, entry in enumerate(entries):
+                if i:
+                    f.write(separator)
+                f.write(_dumps(entry.to_dict(), pretty))
+            f.write(b']}\n')
+    
+    def _append_index(self, entries: List[ActionLogEntry]) -> None:
+        """Append index rows for newly saved session entries."""
+        if not entries:
+            return
         
         try:
-            # Handle compressed files
-            if log_file.suffix == '.gz':
-                with gzip.open(log_file, 'rt') as f:
-                    data = json.load(f)
-            else:
-                with open(log_file, 'r') as f:
-                    data = json.load(f)
+            with open(self.index_path, 'ab') as f:
+                for entry in entries:
+                    f.write(_dumps({
+                        'entry_id': entry.entry_id,
+                        'file': self.current_session_file,
+                        'timestamp': entry.timestamp.isoformat() + 'Z'
+                    }) + b'\n')
+        except OSError as e:
+            logger.warning(f"Failed to update action log index: {e}")
+    
+    def _read_index(self, tail: Optional[int] = None) -> List[Dict]:
+        """
+        Read index rows, oldest first.
+        
+        Args:
+            tail: Only read the last this many rows, seeking back from the end
             
-            # Convert dictionary data back to ActionLogEntry objects
-            for entry_data in data.get('entries', []):
-                entry = self._dict_to_entry(entry_data)
-                if entry:
-                    entries.append(entry)
-                    
+        Returns:
+            List of index rows; unreadable lines are skipped
+        """
+        if tail is not None and tail <= 0:
+            return []
+        
+        try:
+            with open(self.index_path, 'rb') as f:
+                if tail is None:
+                    lines = f.read().splitlines()
+                else:
+                    f.seek(0, os.SEEK_END)
+                    position = f.tell()
+                    chunk = b''
+                    while position > 0 and chunk.count(b'\n') <= tail:
+                        step = min(INDEX_READ_BLOCK, position)
+                        position -= step
+                        f.seek(position)
+                        chunk = f.read(step) + chunk
+                    lines = chunk.splitlines()[-tail:]
+        except OSError:
+            return []
+        
+        rows = []
+        for line in lines:
+            try:
+                rows.append(_loads(line))
+            except ValueError:
+                continue
+        return rows
+    
+    def _prune_index(self, renamed: Optional[Dict[str, str]] = None) -> None:
+        """Point index rows at renamed (compressed) files and drop rows for deleted ones."""
+        renamed = renamed or {}
+        rows = self._read_index()
+        for row in rows:
+            if row.get('file') in renamed:
+                row['file'] = renamed[row['file']]
+        existing = {name for name in {row.get('file') for row in rows}
+                    if name and (self.log_directory / name).exists()}
+        
+        try:
+            with open(self.index_path, 'wb') as f:
+                for row in rows:
+                    if row.get('file') in existing:
+                        f.write(_dumps(row) + b'\n')
+        except OSError as e:
+            logger.warning(f"Failed to prune action log index: {e}")
+    
+    def _load_log_file(self, log_file: Path) -> List[_LazyEntryView]:
+        """Load entries from a log file."""
+        try:
+            records = _read_log_records(log_file)
         except Exception as e:
             logger.error(f"Failed to load log file {log_file}: {e}")
+            return []
         
-        return entries
+        return self._records_to_entries(records)
     
-    def _dict_to_entry(self, entry_data: Dict) -> Optional[ActionLogEntry]:
-        """Convert dictionary data back to ActionLogEntry."""
+    def _load_log_files(self, log_files: List[Path]) -> List[_LazyEntryView]:
+        """
+        Load entries from several log files, in order.
+        
+        With parallel_log_loading enabled, more than one CPU and at least
+        PARALLEL_LOAD_MIN_FILES files, parsing runs in a process pool. Worker processes re-run
+        sys.executable, so this only happens when that is a Python
+        interpreter (inside Fusion 360 it is not); any pool failure falls
+        back to loading in this process.
+        """
+        workers = min(os.cpu_count() or 1, len(log_files))
+        if (not self.parallel_loading or len(log_files) < PARALLEL_LOAD_MIN_FILES
+                or workers < 2 or not _can_spawn_workers()):
+            entries = []
+            for log_file in log_files:
+                entries.extend(self._load_log_file(log_file))
+            return entries
+        
         try:
-            # Create a minimal entry and populate it
-            entry = ActionLogEntry(
-                entry_data['plan_id'],
-                entry_data['plan_data'],
-                entry_data['execution_result'],
-                entry_data.get('timeline_mapping', {})
-            )
+            from concurrent.futures import ProcessPoolExecutor
             
-            # Override with stored values
-            entry.entry_id = entry_data['entry_id']
-            entry.timestamp = datetime.fromisoformat(entry_data['timestamp'].replace('Z', '+00:00'))
-            entry.checksum = entry_data.get('checksum', entry.checksum)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_load_log_records_worker, log_files))
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Parallel log loading failed, loading serially: {e}")
+            self.parallel_loading = False
+            return self._load_log_files(log_files)
+        
+        entries = []
+        for log_file, (records, error) in zip(log_files, results):
+            if error:
+                logger.error(f"Failed to load log file {log_file}: {error}")
+            entries.extend(self._records_to_entries(records))
+        return entries
+    
+    def _records_to_entries(self, records: List[Dict]) -> List[_LazyEntryView]:
+        """Convert stored dictionaries back to entries, skipping invalid ones."""
+        entries = []
+        for entry_data in records:
+            entry = self._dict_to_entry(entry_data)
+            if entry:
+                entries.append(entry)
+        return entries
+    
+    def _dict_to_entry(self, entry_data: Dict) -> Optional[_LazyEntryView]:
+        """Wrap stored dictionary data in a lazy entry view."""
+        try:
+            # Check the fields every view accessor relies on up front
+            missing = [key for key in ('entry_id', 'timestamp', 'plan_id') if key not in entry_data]
+            if missing:
+                raise KeyError(missing[0])
+            if not isinstance(entry_data['plan_data'], dict) or \
+                    not isinstance(entry_data['execution_result'], dict):
+                raise TypeError("plan_data and execution_result must be objects")
             
-            return entry
+            # Parse the timestamp now so entries with a malformed one are
+            # skipped here rather than failing later sorts and filters
+            view = _LazyEntryView(entry_data)
+            view._ts = _parse_timestamp(entry_data['timestamp'])
+            return view
             
         except Exception as e:
             logger.warning(f"Failed to reconstruct log entry: {e}")
@@ -439,44 +1005,88 @@ class ActionLogger:
         """Collect entries matching date criteria."""
         all_entries = []
         
-        # Add current session
+        # Add current session; its saved file repeats these entries, so it
+        # only contributes the ones spilled out of memory
+        all_entries.extend(self._load_spilled_entries())
         all_entries.extend(self.session_entries)
         
         # Load all historical logs
-        log_files = list(self.log_directory.glob("action_log_*.json"))
-        log_files.extend(self.log_directory.glob("action_log_*.json.gz"))
+        skip = {self.current_session_file} if self.session_entries else set()
+        log_files = [log_file for log_file in self._list_log_files() if log_file.name not in skip]
         
-        for log_file in sorted(log_files):
-            try:
-                entries = self._load_log_file(log_file)
-                all_entries.extend(entries)
-            except Exception as e:
-                logger.warning(f"Failed to load log file for export {log_file}: {e}")
+        # Skip files that cannot hold entries in the range before parsing them
+        if start_date or end_date:
+            log_files = [log_file for log_file in log_files
+                         if self._log_file_overlaps(log_file, start_date, end_date)]
+        
+        all_entries.extend(self._load_log_files(log_files))
         
-        # Filter by date range
+        # Filter by date range; session entries are naive UTC, loaded ones
+        # are timezone-aware
+        start = self._naive_utc(start_date) if start_date else None
+        end = self._naive_utc(end_date) if end_date else None
         filtered_entries = []
         for entry in all_entries:
-            if start_date and entry.timestamp < start_date:
+            timestamp = self._naive_utc(entry.timestamp)
+            if start and timestamp < start:
                 continue
-            if end_date and entry.timestamp > end_date:
+            if end and timestamp > end:
                 continue
-            filtered_entries.append(entry)
+            filtered_entries.append((timestamp, entry))
+        
+        filtered_entries.sort(key=lambda item: item[0])
+        return [entry for _, entry in filtered_entries]
+    
+    def _log_file_overlaps(self, log_file: Path, start_date: Optional[datetime],
+                           end_date: Optional[datetime]) -> bool:
+        """
+        Check whether a session log may hold entries between start_date and end_date.
         
-        return sorted(filtered_entries, key=lambda x: x.timestamp)
+        Session files are named after their start time and appended to on every
+        save, so their entries lie between the filename date and the file's
+        modification time. One day of slack absorbs the local/UTC difference
+        between the two. Files without a parsable name date are always kept.
+        """
+        slack = timedelta(days=1)
+        
+        if end_date:
+            started = self._log_file_start(log_file)
+            if started and started > self._naive_utc(end_date) + slack:
+                return False
+        
+        if start_date:
+            try:
+                modified = datetime.utcfromtimestamp(log_file.stat().st_mtime)
+            except OSError:
+                return True
+            if modified < self._naive_utc(start_date) - slack:
+                return False
+        
+        return True
+    
+    @staticmethod
+    def _log_file_start(log_file: Path) -> Optional[datetime]:
+        """Parse the YYYYMMDD_HHMMSS session start from an action_log_*.json* name."""
+        parts = log_file.name.split('.')[0].split('_')
+        try:
+            return datetime.strptime(parts[2] + parts[3], '%Y%m%d%H%M%S')
+        except (ValueError, IndexError):
+            return None
+    
+    @staticmethod
+    def _naive_utc(value: datetime) -> datetime:
+        """Express a possibly timezone-aware datetime as naive UTC."""
+        if value.tzinfo is None:
+            return value
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
     
     def _export_json(self, entries: List[ActionLogEntry], export_path: Path) -> None:
         """Export entries as JSON."""
-        export_data = {
-            'export_info': {
-                'created_at': datetime.utcnow().isoformat() + 'Z',
-                'entry_count': len(entries),
-                'format_version': '1.0'
-            },
-            'entries': [entry.to_dict() for entry in entries]
-        }
-        
-        with open(export_path, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        self._write_entries_json(export_path, 'export_info', {
+            'created_at': datetime.utcnow().isoformat() + 'Z',
+            'entry_count': len(entries),
+            'format_version': '1.0'
+        }, entries)
     
     def _export_csv(self, entries: List[ActionLogEntry], export_path: Path) -> None:
         """Export entries as CSV."""
@@ -486,22 +1096,22 @@ class ActionLogger:
             'human_readable_summary'
         ]
         
-        with open(export_path, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
+        with open(export_path, 'w', newline='', buffering=EXPORT_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
             
-            for entry in entries:
-                writer.writerow({
-                    'entry_id': entry.entry_id,
-                    'timestamp': entry.timestamp.isoformat(),
-                    'plan_id': entry.plan_id,
-                    'natural_language_prompt': entry.natural_language_prompt,
-                    'operation_count': entry.operation_count,
-                    'execution_duration': entry.execution_duration,
-                    'success': entry.success,
-                    'error_message': entry.error_message or '',
-                    'human_readable_summary': entry.get_human_readable_summary()
-                })
+            # Positional rows in fieldnames order, streamed to the writer
+            writer.writerows((
+                entry.entry_id,
+                entry.timestamp.isoformat(),
+                entry.plan_id,
+                entry.natural_language_prompt,
+                entry.operation_count,
+                entry.execution_duration,
+                entry.success,
+                entry.error_message or '',
+                entry.get_human_readable_summary()
+            ) for entry in entries)
     
     def _export_txt(self, entries: List[ActionLogEntry], export_path: Path) -> None:
         """Export entries as human-readable text."""
@@ -553,8 +1163,9 @@ def pretty_print_action_log(entries: List[ActionLogEntry], max_entries: int = 20
     if not entries:
         return "No actions logged yet."
     
-    # Sort by timestamp (most recent first)
-    sorted_entries = sorted(entries, key=lambda x: x.timestamp, reverse=True)
+    # Sort by timestamp (most recent first); session entries are naive UTC,
+    # loaded and spilled ones are timezone-aware
+    sorted_entries = sorted(entries, key=lambda x: ActionLogger._naive_utc(x.timestamp), reverse=True)
     display_entries = sorted_entries[:max_entries]
     
     lines = []
@@ -0,0 +1,280 @@
+"""
+Test suite for the Fusion 360 Co-Pilot Action Log
+
+Tests NDJSON session logs, the entry index, compression, spilling and
+export round-trips.
+
+Author: Fusion CoPilot Team
+License: MIT
+"""
+
+import pytest
+import sys
+import os
+import csv
+import json
+import gzip
+import time
+import shutil
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import action_log
+from action_log import ActionLogger, ActionLogEntry, INDEX_FILENAME, pretty_print_action_log
+
+
+def make_plan(name, distance=10):
+    """Build a small plan with one sketch and one extrude."""
+    return {
+        "plan_id": name,
+        "metadata": {"natural_language_prompt": f"Make {name}"},
+        "operations": [
+            {"op_id": "op_1", "op": "create_sketch", "params": {"name": "base"}},
+            {"op_id": "op_2", "op": "extrude", "params": {"distance": {"value": distance, "unit": "mm"}}}
+        ]
+    }
+
+
+class TestActionLogger:
+    """Test cases for the ActionLogger class."""
+
+    def setup_method(self):
+        """Setup a fresh log directory."""
+        self.log_dir = tempfile.mkdtemp()
+
+    def teardown_method(self):
+        """Remove the log directory."""
+        shutil.rmtree(self.log_dir, ignore_errors=True)
+
+    def make_logger(self, session_file=None, **settings):
+        """Create a logger, optionally pinned to a session file name."""
+        logger = ActionLogger(self.log_dir, settings)
+        if session_file:
+            logger.current_session_file = session_file
+        return logger
+
+    def log_plans(self, logger, count, prefix="plan"):
+        """Log count successful plans and return their entry IDs."""
+        return [
+            logger.log_action(f"{prefix}_{i}", make_plan(f"{prefix}_{i}", i + 1),
+                              {"success": True, "duration_seconds": 0.5})
+            for i in range(count)
+        ]
+
+    def read_lines(self, name):
+        """Read the JSON lines of a file in the log directory."""
+        with open(Path(self.log_dir) / name, 'rb') as f:
+            return [json.loads(line) for line in f.read().splitlines() if line.strip()]
+
+    def test_session_log_is_appended_as_ndjson(self):
+        """Test that each save appends only the new entries."""
+        logger = self.make_logger("action_log_20260101_000000.ndjson")
+        ids = self.log_plans(logger, 2)
+
+        lines = self.read_lines(logger.current_session_file)
+        assert 'session_info' in lines[0]
+        assert [line['entry_id'] for line in lines[1:]] == ids
+
+        ids += self.log_plans(logger, 1, prefix="more")
+        lines = self.read_lines(logger.current_session_file)
+        assert sum('session_info' in line for line in lines) == 1
+        assert [line['entry_id'] for line in lines[1:]] == ids
+
+    def test_truncated_last_line_is_skipped(self):
+        """Test that an interrupted append does not lose the rest of the file."""
+        logger = self.make_logger("action_log_20260101_000000.ndjson")
+        ids = self.log_plans(logger, 2)
+        with open(Path(self.log_dir) / logger.current_session_file, 'ab') as f:
+            f.write(b'{"entry_id": "trunc')
+
+        entries = self.make_logger()._load_log_file(Path(self.log_dir) / logger.current_session_file)
+        assert [entry.entry_id for entry in entries] == ids
+
+    def test_loaded_entries_are_lazy_views(self):
+        """Test that loaded entries expose the logged data and validate timestamps."""
+        logger = self.make_logger("action_log_20260101_000000.ndjson")
+        entry_id = self.log_plans(logger, 1)[0]
+        original = logger.session_entries[0]
+
+        loaded = self.make_logger()._load_log_file(Path(self.log_dir) / logger.current_session_file)
+        assert len(loaded) == 1
+        view = loaded[0]
+        assert not isinstance(view, ActionLogEntry)
+        assert view.entry_id == entry_id
+        assert view.plan_data == original.plan_data
+        assert view.operation_count == 2
+        assert view.get_human_readable_summary() == original.get_human_readable_summary()
+        assert view.checksum == ActionLogEntry._calculate_checksum(view) == original.checksum
+
+        bad = dict(view.to_dict(), timestamp="not a timestamp")
+        assert logger._dict_to_entry(bad) is None
+
+    def test_index_sidecar(self):
+        """Test that saved entries are indexed and replayed through the index."""
+        logger = self.make_logger("action_log_20260101_000000.ndjson")
+        ids = self.log_plans(logger, 3)
+
+        rows = self.read_lines(INDEX_FILENAME)
+        assert [row['entry_id'] for row in rows] == ids
+        assert {row['file'] for row in rows} == {logger.current_session_file}
+
+        reader = self.make_logger()
+        replay = reader.replay_action(ids[1])
+        assert replay['entry_id'] == ids[1]
+        assert replay['plan_data'] == make_plan("plan_1", 2)
+        assert {entry.entry_id for entry in reader.get_recent_entries(2)} == set(ids[1:])
+
+    def test_compression_after_compress_after_days(self, monkeypatch):
+        """Test that finished logs are compressed and stay readable."""
+        for zstd in (True, False):
+            if zstd and not action_log.ZSTD_AVAILABLE:
+                continue
+            monkeypatch.setattr(action_log, 'ZSTD_AVAILABLE', zstd)
+            shutil.rmtree(self.log_dir)
+            os.makedirs(self.log_dir)
+
+            old = self.make_logger("action_log_20260101_000000.ndjson")
+            old_ids = self.log_plans(old, 2, prefix="old")
+            recent = self.make_logger("action_log_20260102_000000.ndjson")
+            self.log_plans(recent, 1, prefix="recent")
+
+            stale = time.time() - 8 * 86400
+            os.utime(Path(self.log_dir) / old.current_session_file, (stale, stale))
+
+            logger = self.make_logger(compress_after_days=7)
+            logger.cleanup_old_logs()
+
+            suffix = '.zst' if zstd else '.gz'
+            compressed = old.current_session_file + suffix
+            assert sorted(os.listdir(self.log_dir)) == sorted(
+                [compressed, recent.current_session_file, INDEX_FILENAME])
+            assert {row['file'] for row in self.read_lines(INDEX_FILENAME)} == {
+                compressed, recent.current_session_file}
+            assert logger.replay_action(old_ids[0])['entry_id'] == old_ids[0]
+            assert logger.get_statistics()['total_actions'] == 3
+
+    def test_compressed_logs_outside_the_index(self):
+        """Test that lookups not covered by the index still read compressed logs."""
+        old = self.make_logger("action_log_20260101_000000.ndjson")
+        old_ids = self.log_plans(old, 3, prefix="old")
+        recent = self.make_logger("action_log_20260102_000000.ndjson")
+        recent_ids = self.log_plans(recent, 2, prefix="recent")
+
+        stale = time.time() - 8 * 86400
+        os.utime(Path(self.log_dir) / old.current_session_file, (stale, stale))
+        self.make_logger(compress_after_days=7).cleanup_old_logs()
+        assert not os.path.exists(Path(self.log_dir) / old.current_session_file)
+
+        # Fewer index rows than requested: the newest log files are scanned
+        logger = self.make_logger()
+        assert {entry.entry_id for entry in logger.get_recent_entries(10)} == set(old_ids + recent_ids)
+
+        # Logs written before the index existed
+        os.remove(Path(self.log_dir) / INDEX_FILENAME)
+        logger = self.make_logger()
+        assert len(logger.get_recent_entries(10)) == 5
+        assert logger.replay_action(old_ids[1])['entry_id'] == old_ids[1]
+
+        # A single-document .json log from before NDJSON, gzipped later
+        legacy = ActionLogEntry("legacy", make_plan("legacy"), {"success": True})
+        document = {"session_info": {"version": "1.0"}, "entries": [legacy.to_dict()]}
+        with gzip.open(Path(self.log_dir) / "action_log_20251201_000000.json.gz", 'wt') as f:
+            json.dump(document, f)
+        logger = self.make_logger()
+        assert logger.replay_action(legacy.entry_id)['entry_id'] == legacy.entry_id
+
+    def test_write_reload_export_cycle(self):
+        """Test that logging, reloading and exporting can be repeated."""
+        first = self.make_logger("action_log_20260101_000000.ndjson")
+        ids = self.log_plans(first, 3)
+
+        for cycle in range(2):
+            logger = self.make_logger()
+            assert sorted(entry.entry_id for entry in logger.get_recent_entries(10)) == sorted(ids)
+
+            for fmt in ('json', 'csv', 'txt'):
+                path = logger.export_action_log(fmt, filename=f"action_log_export_{cycle}.{fmt}")
+                assert os.path.exists(path)
+
+            with open(Path(self.log_dir) / f"action_log_export_{cycle}.json") as f:
+                exported = json.load(f)
+            assert [entry['entry_id'] for entry in exported['entries']] == ids
+            with open(Path(self.log_dir) / f"action_log_export_{cycle}.csv", newline='') as f:
+                rows = list(csv.DictReader(f))
+            assert [row['entry_id'] for row in rows] == ids
+            assert rows[0]['human_readable_summary'] == "✓ sketch(base) → extrude(1mm)"
+
+        stats = self.make_logger().get_statistics()
+        assert stats['total_actions'] == 3
+        assert stats['success_rate'] == 100.0
+
+    def test_export_with_unsaved_session_entries(self):
+        """Test exporting from a logger whose session is also saved to disk."""
+        logger = self.make_logger("action_log_20260101_000000.ndjson")
+        ids = self.log_plans(logger, 2)
+
+        for fmt in ('json', 'csv', 'txt'):
+            logger.export_action_log(fmt, filename=f"action_log_export_x.{fmt}")
+
+        with open(Path(self.log_dir) / "action_log_export_x.json") as f:
+            assert [entry['entry_id'] for entry in json.load(f)['entries']] == ids
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_nan_payload_checksum_round_trip(self, monkeypatch, use_orjson):
+        """Test that non-finite floats do not break a stored entry's checksum."""
+        if use_orjson and not action_log.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(action_log, 'ORJSON_AVAILABLE', use_orjson)
+
+        logger = self.make_logger("action_log_20260101_000000.ndjson")
+        plan = make_plan("nan_plan")
+        plan['operations'][1]['params']['distance']['value'] = float('nan')
+        logger.log_action("nan_plan", plan, {
+            "success": True, "duration_seconds": float('nan'), "samples": [float('inf'), 1.0]})
+        stored = logger.session_entries[0].checksum
+
+        loaded = self.make_logger()._load_log_file(Path(self.log_dir) / logger.current_session_file)
+        assert len(loaded) == 1
+        assert loaded[0].checksum == stored
+        assert ActionLogEntry._calculate_checksum(loaded[0]) == stored
+
+    def test_spill_at_max_session_entries_in_memory(self):
+        """Test that old session entries move to disk but stay reachable."""
+        logger = self.make_logger("action_log_20260101_000000.ndjson",
+                                  max_session_entries_in_memory=3, auto_save_logs=False)
+        ids = self.log_plans(logger, 8)
+
+        assert len(logger.session_entries) == 3
+        assert [entry.entry_id for entry in logger.session_entries] == ids[-3:]
+        assert [line['entry_id'] for line in self.read_lines(logger.current_session_file)[1:]] == ids
+
+        assert [entry.entry_id for entry in logger.get_session_log()] == ids
+        assert {entry.entry_id for entry in logger.get_recent_entries(5)} == set(ids[3:])
+        assert logger.replay_action(ids[0])['entry_id'] == ids[0]
+        assert logger.get_statistics()['total_actions'] == 8
+
+        logger.export_action_log('json', filename="action_log_export_spill.json")
+        with open(Path(self.log_dir) / "action_log_export_spill.json") as f:
+            assert [entry['entry_id'] for entry in json.load(f)['entries']] == ids
+
+    def test_pretty_print_with_spilled_entries(self):
+        """Test printing recent entries that mix in-memory and spilled ones."""
+        logger = self.make_logger("action_log_20260101_000000.ndjson",
+                                  max_session_entries_in_memory=2)
+        self.log_plans(logger, 5)
+
+        recent = logger.get_recent_entries(5)
+        assert {type(entry) for entry in recent} != {ActionLogEntry}
+        output = pretty_print_action_log(recent)
+        assert output.startswith("Recent Actions:")
+        extrudes = [line.split("extrude(")[1].split(")")[0]
+                    for line in output.splitlines() if "extrude(" in line]
+        assert sorted(extrudes) == [f"{i}mm" for i in range(1, 6)]
+
+
+if __name__ == "__main__":
+    # Run tests if executed directly
+    pytest.main([__file__, "-v"])